@@ -1,353 +0,0 @@
-SINGLES = {
-        'accountingEntry': {
-            'codelist': 'IMF:CL_ACCOUNT_ENTRY(1.5.0)',
-            'label': 'Accounting entry code list',
-            'description': """Description not available"""
-        },
-        'referencePeriod': {
-            'codelist': 'ESTAT:CL_REF_PERIOD_DTL(1.0)',
-            'label': 'Reference period detail codes',
-            'description': """Description not available"""
-        },
-        'regionalCodes': {
-            'codelist': 'ESTAT:CL_REGIONAL(6.1.0)',
-            'label': 'Regional codes',
-            'description': """Description not available"""
-        },
-        'reportingType': {
-            'codelist': 'IAEG-SDGs:CL_REPORTING_TYPE(1.0)',
-            'label': 'Reporting type code list',
-            'description': """Reporting type code list"""
-        },
-        'reference/counterpartInstitutional': {
-            'codelist': 'UIS:CL_SECTOR(1.0)',
-            'label': 'Reference/Counterpart institutional sector',
-            'description': """Description not available"""
-        },
-        'sdgSeries': {
-            'codelist': 'IAEG-SDGs:CL_SERIES(1.18)',
-            'label': 'SDG Series Code List',
-            'description': """SDG Series Code List"""
-        },
-        'timeFormat': {
-            'codelist': 'SDMX:CL_TIME_FORMAT(1.0)',
-            'label': 'Time Format',
-            'description': """This code list provides coded information (based on the ISO 8601 standard) indicating the type of time references used in the data. It was released in 2009. More information about this code list and SDMX code lists in general (e.g. list of generic codes for expressing general concepts like "Total", "Unknown", etc.; syntaxes for the creation of further codes; general guidelines for the creation of SDMX code lists) can be found at this address: https://sdmx.org/?page_id=4345."""
-        },
-        'timeTransformation': {
-            'codelist': 'SDMX:CL_TIMETRANS_PER(1.0)',
-            'label': 'Time Transformation Period',
-            'description': """Code list for information about the number of periods used for a time-related transformation of the time series."""
-        },
-        '0timeTransformation': {
-            'codelist': 'SDMX:CL_TIMETRANS_TYPE(1.0)',
-            'label': 'Time Transformation Type',
-            'description': """Code list for time-related transformation types of time series."""
-        },
-        'cl_trade_flow': {
-            'codelist': 'UNSD:CL_TRADE_FLOW(1.0)',
-            'label': 'CL_TRADE_FLOW',
-            'description': """Description not available"""
-        },
-        'cl_trade_system': {
-            'codelist': 'UNSD:CL_TRADE_SYSTEM(1.0)',
-            'label': 'CL_TRADE_SYSTEM',
-            'description': """Description not available"""
-        },
-        'cl_transport_mode': {
-            'codelist': 'UNSD:CL_TRANSPORT_MODE(1.0)',
-            'label': 'CL_TRANSPORT_MODE',
-            'description': """Description not available"""
-        },
-        'typeEntity': {
-            'codelist': 'OECD:CL_TYPE_ENTITY(1.1)',
-            'label': 'Type of entity code list',
-            'description': """Description not available"""
-        },
-        'typeExpenditure': {
-            'codelist': 'UIS:CL_TYPE_EXP_REPORTED(1.0)',
-            'label': 'Type of expenditure reported',
-            'description': """Description not available"""
-        },
-        'unitMultiplier': {
-            'codelist': 'SDMX:CL_UNIT_MULT(1.1)',
-            'label': 'Unit Multiplier',
-            'description': """This code list provides code values for indicating the magnitude in the units of measurement. More information about this code list and SDMX code lists in general (e.g. list of generic codes for expressing general concepts like "Total", "Unknown", etc.; syntaxes for the creation of further codes; general guidelines for the creation of SDMX code lists) can be found at this address: https://sdmx.org/?page_id=4345."""
-        },
-        'valuation': {
-            'codelist': 'ESTAT:CL_VALUATION(1.6)',
-            'label': 'Valuation',
-            'description': """Description not available"""
-        },
-        'valuesAp': {
-            'codelist': 'ESTAT:CL_VALUE_AP(1.0)',
-            'label': 'Values for AP DSD',
-            'description': """Description not available"""
-        },
-        'waterFlows': {
-            'codelist': 'ESTAT:CL_WATER_FLOWS(1.0)',
-            'label': 'Water flows',
-            'description': """Sources of abstracted water, waste water, return flows of water (+breakdowns)"""
-        },
-        'airPollutants': {
-            'codelist': 'ESTAT:CL_AIRPOL(1.3.0)',
-            'label': 'Air pollutants and greenhouse gasses',
-            'description': """Air pollutants classification"""
-        },
-        'administeredPrices': {
-            'codelist': 'ESTAT:CL_AP_DEFINITION(1.0)',
-            'label': 'Administered prices indicator',
-            'description': """Description not available"""
-        },
-        'reasonThe': {
-            'codelist': 'SDMX:CL_BREAK_REASON(1.0)',
-            'label': 'Reason for the break in time series',
-            'description': """Description not available"""
-        },
-        'breakdownGroup': {
-            'codelist': 'UIS:CL_BREAKDOWN_GROUP(1.0)',
-            'label': 'Breakdown group',
-            'description': """Description not available"""
-        },
-        'bridgingItems': {
-            'codelist': 'ESTAT:CL_BRIDGE_ITEM(1.3.0)',
-            'label': 'Bridging items',
-            'description': """Items used to bridge for territorial coverage"""
-        },
-        'civil(or': {
-            'codelist': 'SDMX:CL_CIVIL_STATUS(1.0)',
-            'label': 'Civil (or Marital) Status',
-            'description': """This code list provides a list of values for describing the civil (or marital) status of an individual, i.e. the legal, conjugal status of an individual in relation to the marriage laws or customs of the country. This code list was formally adopted on 25 November 2013. More information about this code list and SDMX code lists in general (e.g. list of generic codes for expressing general concepts like "Total", "Unknown", etc.; syntaxes for the creation of further codes; general guidelines for the creation of SDMX code lists) can be found at this address: https://sdmx.org/?page_id=4345."""
-        },
-        'cl_commodity': {
-            'codelist': 'UNSD:CL_COMMODITY(1.0)',
-            'label': 'CL_COMMODITY',
-            'description': """Description not available"""
-        },
-        'sdgComposite': {
-            'codelist': 'IAEG-SDGs:CL_COMP_BREAKDOWN(1.18)',
-            'label': 'SDG composite breakdown code list',
-            'description': """Description not available"""
-        },
-        'compilationMethodology': {
-            'codelist': 'IMF:CL_COMP_METHOD(1.2)',
-            'label': 'Compilation methodology code list',
-            'description': """Description not available"""
-        },
-        'confidentialityStatus': {
-            'codelist': 'SDMX:CL_CONF_STATUS(1.3)',
-            'label': 'Confidentiality Status',
-            'description': """Description not available"""
-        },
-        'geographicalCoverage': {
-            'codelist': 'ESTAT:CL_COVERAGE_GEO(1.0)',
-            'label': 'Geographical coverage',
-            'description': """Defines which type of region is used to compile the index"""
-        },
-        'populationCoverage': {
-            'codelist': 'ESTAT:CL_COVERAGE_POP(1.1.0)',
-            'label': 'Population coverage',
-            'description': """Description not available"""
-        },
-        'currencyIssuance': {
-            'codelist': 'IMF:CL_CURRENCY(1.6)',
-            'label': 'Currency of issuance or invoicing code list',
-            'description': """Description not available"""
-        },
-        'cl_customs_proc': {
-            'codelist': 'UNSD:CL_CUSTOMS_PROC(1.0)',
-            'label': 'CL_CUSTOMS_PROC',
-            'description': """Description not available"""
-        },
-        'decimals': {
-            'codelist': 'SDMX:CL_DECIMALS(1.0)',
-            'label': 'Decimals',
-            'description': """This code list provides a list of values showing the number of decimal digits used in the data. This code list was released in 2009. More information about this code list and SDMX code lists in general (e.g. list of generic codes for expressing general concepts like "Total", "Unknown", etc.; syntaxes for the creation of further codes; general guidelines for the creation of SDMX code lists) can be found at this address: https://sdmx.org/?page_id=4345."""
-        },
-        'demandOr': {
-            'codelist': 'ESTAT:CL_DEMAND_PROD(1.0)',
-            'label': 'Demand or production',
-            'description': """Description not available"""
-        },
-        'disabilityStatus': {
-            'codelist': 'IAEG-SDGs:CL_DISABILITY(1.0)',
-            'label': 'Disability status code list',
-            'description': """Description not available"""
-        },
-        'edpWorking': {
-            'codelist': 'ESTAT:CL_EDP_WBB(1.0)',
-            'label': 'EDP working balance basis',
-            'description': """Description not available"""
-        },
-        'tableIdentifier': {
-            'codelist': 'UIS:CL_EDU_TABLEID(1.0)',
-            'label': 'Table identifier',
-            'description': """Description not available"""
-        },
-        'fieldsEducation': {
-            'codelist': 'UIS:CL_EDUCATION_FIELD(1.0)',
-            'label': 'Fields of education',
-            'description': """Description not available"""
-        },
-        'educationType': {
-            'codelist': 'UIS:CL_EDUCATION_TYPE(1.0)',
-            'label': 'Education type',
-            'description': """Description not available"""
-        },
-        'energyFlows': {
-            'codelist': 'ESTAT:CL_ENERGY_FLOWS(1.2)',
-            'label': 'Energy flows',
-            'description': """Natural energy inputs (broken down), energy products (broken down), residuals (broken down)"""
-        },
-        'expenditureType': {
-            'codelist': 'UIS:CL_EXPENDITURE_TYPE(1.0)',
-            'label': 'Expenditure type',
-            'description': """Description not available"""
-        },
-        'fdiRelationship': {
-            'codelist': 'OECD:CL_FDI_RELATION(1.0)',
-            'label': 'FDI relationship code list',
-            'description': """Description not available"""
-        },
-        'codeList': {
-            'codelist': 'SDMX:CL_FREQ(2.1)',
-            'label': 'Code list for concept "Frequency"',
-            'description': """This code list provides a set of values indicating the
-          "frequency" of the data (e.g. weekly, monthly, quarterly). The concept "frequency" may
-          refer to various stages in the production process, e.g. data collection or data
-          dissemination. For example, a time series could be disseminated at annual frequency but
-          the underlying data are compiled monthly. The code list is applicable for all different
-          uses of "frequency"."""
-        },
-        'functionalCategory': {
-            'codelist': 'IMF:CL_FUNCTIONAL_CAT(1.10.1)',
-            'label': 'Functional category code list',
-            'description': """Description not available"""
-        },
-        'geoinformationType': {
-            'codelist': 'IAEG-SDGs:CL_GEO_INFO_TYPE(1.0)',
-            'label': 'Geoinformation type code list',
-            'description': """Description not available"""
-        },
-        'gfsEconomic': {
-            'codelist': 'ESTAT:CL_GFS_ECOFUNC(1.0)',
-            'label': 'GFS economic function',
-            'description': """Description not available"""
-        },
-        'gfsTax': {
-            'codelist': 'ESTAT:CL_GFS_TAXCAT(1.2)',
-            'label': 'GFS tax category',
-            'description': """Description not available"""
-        },
-        'stocks,Transactions,': {
-            'codelist': 'IMF:CL_GFSM_STO(1.0)',
-            'label': 'Stocks, Transactions, Other Flows',
-            'description': """Description not available"""
-        },
-        'grade': {
-            'codelist': 'UIS:CL_GRADE(1.0)',
-            'label': 'Grade',
-            'description': """Description not available"""
-        },
-        'indexType': {
-            'codelist': 'ESTAT:CL_IDX_TYPE(1.0)',
-            'label': 'Index type',
-            'description': """Differentiates between different types of indices"""
-        },
-        'indicatorType': {
-            'codelist': 'ESTAT:CL_IND_TYPE(1.1)',
-            'label': 'Indicator type',
-            'description': """Description not available"""
-        },
-        'intensity': {
-            'codelist': 'UIS:CL_INTENSITY(1.0)',
-            'label': 'Intensity',
-            'description': """Description not available"""
-        },
-        'unitsInteracting': {
-            'codelist': 'ESTAT:CL_INTERACTORS(1.3)',
-            'label': 'Units interacting with the environment',
-            'description': """(emitting green house gases and air pollutants, suppliers / consumers of energy, water, natural resources)
-Covers ISIC/NACE, households and Total"""
-        },
-        'itemThe': {
-            'codelist': 'ESTAT:CL_ITEM_PRICE(2.0)',
-            'label': 'Item in the classification',
-            'description': """Description not available"""
-        },
-        'levelCounterpart': {
-            'codelist': 'OECD:CL_LEV_COUNTERPART(1.0)',
-            'label': 'Level of counterpart code list',
-            'description': """Description not available"""
-        },
-        'materials': {
-            'codelist': 'ESTAT:CL_MATERIAL(1.1)',
-            'label': 'Materials',
-            'description': """Materials classification (products, natural inputs, semi-manufactured products, balancing items)"""
-        },
-        'originalAnd': {
-            'codelist': 'ESTAT:CL_MATURITY(1.8)',
-            'label': 'Original and Residual Maturity',
-            'description': """Description not available"""
-        },
-        'cl_measure': {
-            'codelist': 'UNSD:CL_MEASURE(1.0)',
-            'label': 'CL_MEASURE',
-            'description': """Description not available"""
-        },
-        'measurementPrinciple': {
-            'codelist': 'OECD:CL_MEASURE_PRINCIP(1.0)',
-            'label': 'Measurement principle code list',
-            'description': """Description not available"""
-        },
-        'mobility': {
-            'codelist': 'UIS:CL_MOBILITY(1.0)',
-            'label': 'Mobility',
-            'description': """Description not available"""
-        },
-        'consolidationCodes': {
-            'codelist': 'ESTAT:CL_NA_CONSOLIDAT(1.3)',
-            'label': 'Consolidation codes',
-            'description': """Description not available"""
-        },
-        'priceCodes': {
-            'codelist': 'ESTAT:CL_NA_PRICES(1.1)',
-            'label': 'Price codes',
-            'description': """Description not available"""
-        },
-        'naTable': {
-            'codelist': 'ESTAT:CL_NA_TABLEID(1.10)',
-            'label': 'NA Table IDs',
-            'description': """Description not available"""
-        },
-        'natureCode': {
-            'codelist': 'IAEG-SDGs:CL_NATURE(1.0)',
-            'label': 'Nature code list',
-            'description': """Description not available"""
-        },
-        'compilingOrganisation': {
-            'codelist': 'IMF:CL_ORGANISATION(1.14.0)',
-            'label': 'Compiling organisation code list',
-            'description': """Description not available"""
-        },
-        'originCriterion': {
-            'codelist': 'UIS:CL_ORIGIN_CRITERION(1.0)',
-            'label': 'Origin criterion',
-            'description': """Description not available"""
-        },
-        'cl_partner_type': {
-            'codelist': 'UNSD:CL_PARTNER_TYPE(1.0)',
-            'label': 'CL_PARTNER_TYPE',
-            'description': """Description not available"""
-        },
-        'pensionFund': {
-            'codelist': 'ESTAT:CL_PENS_FUNDTYPE(1.2)',
-            'label': 'Pension Fund Type',
-            'description': """Description not available"""
-        },
-        'income/wealthQuantile': {
-            'codelist': 'IAEG-SDGs:CL_QUANTILE(1.1)',
-            'label': 'Income/wealth quantile code list',
-            'description': """Description not available"""
-        },
-    }
\ No newline at end of file
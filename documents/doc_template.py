@@ -1,6 +1,4 @@
 # doc_template.py
-from datetime import date
-from rdflib import Namespace
 
 def parse_xml_to_ttl_from_url(xml_url, old_model_url, new_model_doc, new_model_url, ttl_output, codelist_output, tuning_output, comment_output, include_context=False, tuning = True):
     """Main function for parsing XML, loading the old model, and generating a new RDF model.
@@ -1,10 +1,8 @@
-import pandas as pd
 import argparse
+import csv
+import os
+from operator import itemgetter
 from pathlib import Path
-from src.sdmxclgen.download_xml_gr_cl import download_xml
-from src.sdmxclgen.analyze_sdmx_cl import cl_analysis
-from src.sdmxclgen.get_analyze_func import get_multiple_codelists_per_agency
-from src.sdmxclgen.gen_cl_ttl import sdmx_codelist_gen
 
 #if __name__ == '__main__':
 def main():
@@ -24,32 +22,45 @@ def main():
     - RDF files in TTL format
     """
     parser = argparse.ArgumentParser(description='Download XML codelists')
-    parser.add_argument('--enable_xml_download', type=bool, default=False, help='Flag to enable XML download')
-    parser.add_argument('--enable_code_list_analysis', type=bool, default=False, help='Flag to enable codelist analysis')
+    parser.add_argument('--enable_xml_download', action='store_true', help='Flag to enable XML download')
+    parser.add_argument('--enable_code_list_analysis', action='store_true', help='Flag to enable codelist analysis')
     args = parser.parse_args()
 
     # Paths to data and directorie
     input_cl_path = Path("in/Code_Lists_GR_SDMX.csv")  # CSV file with codelist URLs
     xml_download_dir = Path("sdmx_codelists")  # Folder for downloaded XML
 
-    # Load codelists from CSV
-    df = pd.read_csv(input_cl_path, delimiter=";")
+    # Load codelists from CSV (utf-8-sig: the file may start with a BOM),
+    # keeping only the two columns used: (URL, codelistID)
+    with open(input_cl_path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f, delimiter=";")
+        header = next(reader)
+        get_columns = itemgetter(header.index("URL"), header.index("codelistID"))
+        rows = [get_columns(row) for row in reader if row]
 
+    # Stage modules are imported inside their branches, so a run pays only
+    # for the subsystems (requests, pandas, rdflib) it actually uses
     if args.enable_xml_download:
+        from src.sdmxclgen.download_xml_gr_cl import (
+            download_xml_many, load_manifest, save_manifest, MANIFEST_NAME
+        )
+
         # Create folder for XML files
         xml_download_dir.mkdir(parents=True, exist_ok=True)
-        # Download codelists
-        successful_downloads = 1
-        for row in df.itertuples(index=False):
-            url = row.URL
-            codelist_id = row.codelistID
-            xml_filename = xml_download_dir / f"{successful_downloads}-{codelist_id}.xml"
+        # Manifest of previous downloads: unchanged files are not fetched again
+        manifest_path = xml_download_dir / MANIFEST_NAME
+        manifest = load_manifest(manifest_path)
 
-            # Download
-            if download_xml(url, str(xml_filename)):
-                successful_downloads += 1
+        # Download codelists in parallel (network-bound, one task per row)
+        base = str(xml_download_dir)
+        tasks = [
+            (url, os.path.join(base, f"{i}-{codelist_id}.xml"))
+            for i, (url, codelist_id) in enumerate(rows, 1)
+        ]
+        successful_downloads = sum(download_xml_many(tasks, manifest=manifest))
+        save_manifest(manifest, manifest_path)
 
-        print(f"Done! Saved {successful_downloads - 1} XML files in {xml_download_dir}")
+        print(f"Done! Saved {successful_downloads} XML files in {xml_download_dir}")
 
     # Paths to analysis files
     analysis_dir = Path("analysis")     # Folder for storing analysis results
@@ -60,7 +71,10 @@ def main():
 
     # Analyze main characteristics of codelists (--enable_code_list_analysis)
     if args.enable_code_list_analysis:
-        if not analysis_dir.exists() :
+        from src.sdmxclgen.analyze_sdmx_cl import cl_analysis
+        from src.sdmxclgen.get_analyze_func import get_multiple_codelists_per_agency
+
+        if not os.path.isdir(analysis_dir):
             analysis_dir.mkdir(parents=True, exist_ok=True)
         if cl_analysis(xml_download_dir, full_cl_csv, cl_table_csv, filtered_cl_csv, filtered_cl_table_csv):
             print("\nAnalysis completed successfully")
@@ -74,8 +88,9 @@ def main():
                     print(f"  Agency {agency}: {cls}")
 
     # RDF model generation
+    from src.sdmxclgen.gen_cl_ttl import sdmx_codelist_gen
     out_dir = Path("cl_out")
-    if not out_dir.exists():
+    if not os.path.isdir(out_dir):
         out_dir.mkdir(parents=True, exist_ok=True)
     sdmx_codelist_gen(cl_table_csv, full_cl_csv, out_dir)
 
@@ -2,8 +2,17 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright (c) 2025 Semantic R&D Group
 
-import re
-from collections import Counter
+from collections import Counter, defaultdict
+import numpy as np
+import pandas as pd
+
+# Arrow-backed strings run the .str predicates in compiled kernels;
+# pyarrow is optional, without it pandas' own string dtype is used
+try:
+    import pyarrow  # noqa: F401
+    CODE_DTYPE = "string[pyarrow]"
+except ImportError:
+    CODE_DTYPE = "string"
 
 
 def analyze_groups(df_code_lists):
@@ -50,13 +59,19 @@ def analyze_groups(df_code_lists):
     >>> analyze_groups(df_code_lists)
     (2, 3, {'SCH1': 2, 'SCH3': 1}, 1)
     """
-    group_counts = df_code_lists[df_code_lists["GroupType"] == "GROUP"].groupby("SchemeID")["CodelistID"].count()
+    # One pass over a categorical GroupType yields both the GROUP and the SINGLE branch
+    by_type = df_code_lists.groupby(df_code_lists["GroupType"].astype("category"), observed=True)
+    type_names = by_type.groups.keys()
+
+    if "GROUP" in type_names:
+        group_counts = by_type.get_group("GROUP").groupby("SchemeID")["CodelistID"].count()
+    else:
+        group_counts = pd.Series(dtype="int64")
 
-    single_counts = df_code_lists[df_code_lists["GroupType"] == "SINGLE"]["CodelistID"].count()
-    single_count = single_counts.sum()
+    single_count = int(by_type["CodelistID"].count().get("SINGLE", 0))
 
-    total_groups = group_counts.shape[0]
-    total_codelists_in_groups = group_counts.sum()
+    total_groups = int(group_counts.shape[0])
+    total_codelists_in_groups = int(group_counts.sum())
 
     return total_groups, total_codelists_in_groups, group_counts.to_dict(), single_count
 
@@ -71,7 +86,7 @@ def evaluate_code_uniqueness(codelists, common_codes):
     codelists : dict
         Dictionary where the key is the codelist identifier,
         and the value is a dictionary with key "codes" containing a list of codes.
-        Each code inside "codes" is represented as [codelist_id, agency, code_value, code_description].
+        Each code inside "codes" is represented as (code_value, code_description).
     common_codes : set
         Set of "common" codes to exclude when calculating unique codes.
 
@@ -89,34 +104,41 @@ def evaluate_code_uniqueness(codelists, common_codes):
     Examples
     --------
     >>> sample_codelists = {
-    ...     "CL1": {"codes": [["CL1", "AG1", "CODE1", "desc1"], ["CL1", "AG1", "CODE2", "desc2"]]},
-    ...     "CL2": {"codes": [["CL2", "AG2", "CODE2", "desc2"], ["CL2", "AG2", "CODE3", "desc3"]]}
+    ...     "CL1": {"codes": [("CODE1", "desc1"), ("CODE2", "desc2")]},
+    ...     "CL2": {"codes": [("CODE2", "desc2"), ("CODE3", "desc3")]}
     ... }
     >>> common_codes_set = {"COMMON1", "COMMON2"}
     >>> evaluate_code_uniqueness(sample_codelists, common_codes_set)
     (3, 2, 0.6666666666666666)
     """
-    all_codes = []
-    for codelist_id, data in codelists.items():
-        if codelist_id is None:
-            continue
-        for entry in data["codes"]:
-            # entry[2] — it`s a code
-            if entry[2] in common_codes:
-                continue
-            all_codes.append(entry[2])
-
-    code_counts = Counter(all_codes)
-
-    total_codes = len(all_codes)
-    unique_codes = sum(1 for count in code_counts.values() if count == 1)
+    # entry[0] — it`s a code (always a str); one flat pass, counting is done by numpy in C
+    codes_list = [
+        entry[0]
+        for codelist_id, data in codelists.items() if codelist_id is not None
+        for entry in data["codes"] if entry[0] not in common_codes
+    ]
+    # Fixed-width unicode array keeps np.unique on its fast (non-object) sorting path
+    all_codes = np.asarray(codes_list, dtype=np.str_)
+    _, code_counts = np.unique(all_codes, return_counts=True)
+
+    total_codes = int(all_codes.size)
+    unique_codes = int((code_counts == 1).sum())
 
     uniqueness_ratio = (unique_codes / total_codes) if total_codes > 0 else 0
 
     return total_codes, unique_codes, uniqueness_ratio
 
 
-def common_codes_def(codelists):
+# Numbers from 1 to 10, always treated as common codes
+_DIGIT_COMMONS = frozenset(map(str, range(1, 11)))
+
+
+def _is_underscore_word(code):
+    """Returns True for two-character codes '_' + word character (the regex ``_\\w``, Unicode-aware)."""
+    return len(code) == 2 and code[0] == "_" and (code[1].isalnum() or code[1] == "_")
+
+
+def common_codes_def(codelists, return_all_codes=True):
     """
     Defines the overall set of codes (all_codes) and a set of typical codes (common_codes),
     including patterns like '_Z' and numbers from 1 to 10.
@@ -125,51 +147,221 @@ def common_codes_def(codelists):
     ----------
     codelists : dict
         Dictionary where the key is the codelist identifier,
-        and the value contains key 'codes' with lists [codelist_id, agency, code_value, code_description].
+        and the value contains key 'codes' with tuples (code_value, code_description).
+    return_all_codes : bool
+        If True (default), the list of all codes is built and returned.
+        If False, codes are scanned in a single pass without building the list, and None is returned instead.
 
     Returns
     -------
     tuple
         (all_codes, common_codes), where:
-        - all_codes : list
-            List (not set) of all code values across all codelists.
-        - common_codes : set
+        - all_codes : list or None
+            List (not set) of all code values across all codelists (None if return_all_codes=False).
+        - common_codes : frozenset
             Set of codes matching the format (e.g., '_Z') or
             being numbers from '1' to '10'.
 
     Examples
     --------
     >>> codelists_example = {
-    ...     "CL1": {"codes": [["CL1", "AG1", "_A", "some desc"], ["CL1", "AG1", "5", "desc2"]]},
-    ...     "CL2": {"codes": [["CL2", "AG2", "_B", "another desc"], ["CL2", "AG2", "XYZ", "desc3"]]}
+    ...     "CL1": {"codes": [("_A", "some desc"), ("5", "desc2")]},
+    ...     "CL2": {"codes": [("_B", "another desc"), ("XYZ", "desc3")]}
     ... }
     >>> all_codes, common_codes = common_codes_def(codelists_example)
     >>> print(all_codes)
     ['_A', '5', '_B', 'XYZ']
-    >>> print(common_codes)
-    {'_A', '_B', '1', '2', '3', '4', '5', '6', '7', '8', '9', '10'}
+    >>> print(sorted(common_codes))
+    ['1', '10', '2', '3', '4', '5', '6', '7', '8', '9', '_A', '_B']
+    """
+    codes = (
+        entry[0]
+        for codelist_id, data in codelists.items() if codelist_id is not None
+        for entry in data["codes"]
+    )
+    all_codes = list(codes) if return_all_codes else None
+
+    # Find codes like '_\w' (e.g., '_Z'); same as re.fullmatch(r"_\w", code), plus numbers from 1 to 10
+    common_codes = frozenset(
+        code for code in (all_codes if return_all_codes else codes) if _is_underscore_word(code)
+    ) | _DIGIT_COMMONS
+
+    return all_codes, common_codes
+
+
+def build_code_to_cls(codelists):
+    """
+    Builds an inverted index: code value -> number of distinct codelists containing it.
+
+    Parameters
+    ----------
+    codelists : dict
+        All code lists, where key = codelist_id, and value contains key 'codes'
+        with tuples (code_value, code_description).
+
+    Returns
+    -------
+    collections.Counter
+        Counter { code_value: number of codelists }.
+
+    Notes
+    -----
+    Built once per set of codelists in a single pass, so that ``com_uniq_code``
+    does not rescan all other codelists for each codelist (O(N·M) instead of O(N²·M)).
+
+    Examples
+    --------
+    >>> build_code_to_cls({
+    ...     "CL1": {"codes": [("A", ""), ("A", ""), ("B", "")]},
+    ...     "CL2": {"codes": [("B", "")]}
+    ... })
+    Counter({'B': 2, 'A': 1})
     """
-    all_codes = []
+    code_to_cl_count = Counter()
     for codelist_id, data in codelists.items():
         if codelist_id is None:
             continue
-        for entry in data["codes"]:
-            all_codes.append(entry[2])
+        code_to_cl_count.update({entry[0] for entry in data["codes"]})
+    return code_to_cl_count
+
+
+def count_codes_per_cl(codelists, common_codes):
+    """
+    Counts, for every codelist at once, its codes: all entries, distinct codes,
+    distinct unique codes (non-common codes that occur in no other codelist) and distinct common codes.
+
+    Parameters
+    ----------
+    codelists : dict
+        All code lists, where key = codelist_id, and value contains key 'codes'
+        with tuples (code_value, code_description).
+    common_codes : set
+        Set of "common" codes (see common_codes_def), never counted as unique.
 
-    common_codes = set()
+    Returns
+    -------
+    pandas.DataFrame
+        Indexed by codelist_id (in the order of `codelists`), with int64 columns:
+        - "size": number of code entries (duplicates included);
+        - "total": number of distinct codes;
+        - "unique": number of distinct unique codes;
+        - "common": number of distinct common codes.
 
-    # Find codes like '_\w' (e.g., '_Z')
-    for code in all_codes:
-        if re.fullmatch(r"_\w", code):
-            common_codes.add(code)
+    Notes
+    -----
+    1. All codes are factorized to integer IDs once (``pd.factorize``).
+    2. (codelist, code) pairs are deduplicated with ``np.unique``, then ``np.bincount``
+       over the code IDs gives the number of codelists containing each code.
+    3. Further ``np.bincount`` calls over the codelist index of the pairs give the per-codelist
+       counts (all pairs, pairs whose code is owned by a single codelist, pairs of common codes),
+       with no Python-level loop.
+    4. "unique" equals ``len(unique_codes_set)`` from ``com_uniq_code``.
+
+    Examples
+    --------
+    >>> count_codes_per_cl({
+    ...     "CL1": {"codes": [("A", ""), ("A", ""), ("B", "")]},
+    ...     "CL2": {"codes": [("B", ""), ("_Z", "")]}
+    ... }, {"_Z"})
+         size  total  unique  common
+    CL1     3      2       1       0
+    CL2     2      2       0       1
+    """
+    cl_ids = [codelist_id for codelist_id in codelists if codelist_id is not None]
+    n_cls = len(cl_ids)
+    lengths = np.fromiter((len(codelists[cl]["codes"]) for cl in cl_ids), dtype=np.int64, count=n_cls)
+    ids, uniques = pd.factorize(
+        np.array([entry[0] for cl in cl_ids for entry in codelists[cl]["codes"]], dtype=object)
+    )
+    n_codes = len(uniques)
+    counts = pd.DataFrame({"size": lengths, "total": 0, "unique": 0, "common": 0},
+                          index=pd.Index(cl_ids, dtype=object), dtype=np.int64)
+    if n_codes == 0:
+        return counts
+
+    # Distinct (codelist, code) pairs encoded as one int64 key
+    cl_index = np.repeat(np.arange(n_cls, dtype=np.int64), lengths)
+    pairs = np.unique(cl_index * n_codes + ids)
+    pair_cl, pair_code = np.divmod(pairs, n_codes)
+
+    cls_per_code = np.bincount(pair_code, minlength=n_codes)
+    is_common = np.fromiter((code in common_codes for code in uniques), dtype=bool, count=n_codes)
+    common_pair = is_common[pair_code]
+    unique_pair = (cls_per_code[pair_code] == 1) & ~common_pair
+
+    counts["total"] = np.bincount(pair_cl, minlength=n_cls)
+    counts["unique"] = np.bincount(pair_cl[unique_pair], minlength=n_cls)
+    counts["common"] = np.bincount(pair_cl[common_pair], minlength=n_cls)
+    return counts
+
+
+def iter_unique_codelist_waves(codelists, common_codes):
+    """
+    Yields successive "waves" of codelists without shared codes, removing each wave
+    before computing the next one.
 
-    # Add numbers from 1 to 10
-    common_codes.update(map(str, range(1, 11)))
+    Parameters
+    ----------
+    codelists : dict
+        Code lists under analysis, where key = codelist_id, and value contains key 'codes'
+        with tuples (code_value, code_description).
+    common_codes : set
+        Set of "common" codes (see common_codes_def), ignored when looking for shared codes.
 
-    return all_codes, common_codes
+    Yields
+    ------
+    list of str
+        Identifiers of the codelists whose non-common codes occur in no other remaining
+        codelist (i.e. 'Shared Codes' == 0 as computed by ``save_codelist_data``).
 
+    Notes
+    -----
+    1. An inverted index code -> set of codelists is built once.
+    2. Removing a wave can only make codes of the remaining codelists more unique, so after
+       each wave only codelists that became sole owners of some code are re-checked.
+    3. The waves are the same as recomputing the codelist table after each removal,
+       without rebuilding it.
 
-def com_uniq_code(codelists, common_codes, unique_codes_count, codelist_id, code_set):
+    Examples
+    --------
+    >>> cls = {
+    ...     "CL1": {"codes": [("A", ""), ("B", "")]},
+    ...     "CL2": {"codes": [("B", ""), ("C", "")]},
+    ...     "CL3": {"codes": [("C", ""), ("D", "")]},
+    ...     "CL4": {"codes": [("E", "")]}
+    ... }
+    >>> list(iter_unique_codelist_waves(cls, set()))
+    [['CL4']]
+    """
+    cl_codes = {}
+    code_to_cls = defaultdict(set)
+    for codelist_id, data in codelists.items():
+        if codelist_id is None:
+            continue
+        codes = {entry[0] for entry in data["codes"]} - common_codes
+        cl_codes[codelist_id] = codes
+        for code in codes:
+            code_to_cls[code].add(codelist_id)
+
+    candidates = list(cl_codes)
+    while True:
+        wave = [cl_id for cl_id in candidates if all(len(code_to_cls[code]) == 1 for code in cl_codes[cl_id])]
+        if not wave:
+            return
+        yield wave
+
+        # Remove the wave; codelists left as sole owners of a code are re-checked
+        affected = set()
+        for cl_id in wave:
+            for code in cl_codes.pop(cl_id):
+                owners = code_to_cls[code]
+                owners.discard(cl_id)
+                if len(owners) == 1:
+                    affected |= owners
+        candidates = [cl_id for cl_id in affected if cl_id in cl_codes]
+
+
+def com_uniq_code(codelists, common_codes, unique_codes_count, codelist_id, code_set, code_to_cl_count=None):
     """
     Determines for a given codelist (codelist_id) the set of codes, dividing them into:
     (1) "common" (common_code_set), (2) unique relative to other CLs (unique_codes_set),
@@ -187,6 +379,10 @@ def com_uniq_code(codelists, common_codes, unique_codes_count, codelist_id, code
         Current codelist being analyzed.
     code_set : set
         Set of codes belonging to codelist_id before removing "common" codes.
+    code_to_cl_count : collections.Counter, optional
+        Index from ``build_code_to_cls(codelists)``. If given, a code is unique
+        when it occurs in exactly one codelist, and other codelists are not rescanned;
+        pass it when the function is called for many codelists of the same set.
 
     Returns
     -------
@@ -202,21 +398,24 @@ def com_uniq_code(codelists, common_codes, unique_codes_count, codelist_id, code
     Notes
     -----
     1. Remove from code_set all codes present in common_codes.
-    2. Collect all codes from other codelists and compare to find truly unique codes.
+    2. Look the codes up in the inverted index code -> number of codelists
+       (``code_to_cl_count``, built here with ``build_code_to_cls`` if it is not given):
+       a code occurs in another codelist when it is counted for more codelists than
+       codelist_id itself accounts for.
 
     Examples
     --------
     >>> codelists_mock = {
     ...     "CL1": {
     ...         "codes": [
-    ...             ["CL1", "AG1", "_A", "desc"],
-    ...             ["CL1", "AG1", "CODE1", "desc"]
+    ...             ("_A", "desc"),
+    ...             ("CODE1", "desc")
     ...         ]
     ...     },
     ...     "CL2": {
     ...         "codes": [
-    ...             ["CL2", "AG2", "_B", "desc"],
-    ...             ["CL2", "AG2", "CODE2", "desc"]
+    ...             ("_B", "desc"),
+    ...             ("CODE2", "desc")
     ...         ]
     ...     }
     ... }
@@ -228,26 +427,44 @@ def com_uniq_code(codelists, common_codes, unique_codes_count, codelist_id, code
     common_code_set = common_codes & code_set
     code_set = code_set - common_code_set
 
-    other_codes_list = []
-    for cl_id, ot_entry in codelists.items():
-        if cl_id is None:
-            continue
-        if cl_id != codelist_id:
-            for codes in ot_entry["codes"]:
-                other_codes_list.append(codes[2])
-    other_codes = set(other_codes_list)
+    if code_to_cl_count is not None:
+        unique_codes_set = {code for code in code_set if code_to_cl_count[code] == 1}
+        return code_set, common_code_set, unique_codes_set
 
-    if len(other_codes) > unique_codes_count:
-        print(f"{codelist_id}: ERROR! Total number of codes in other codelists = ", len(other_codes))
+    # One pass over all codelists builds the index; own codes of codelist_id are subtracted from it
+    code_to_cl_count = build_code_to_cls(codelists)
+    own_entry = codelists.get(codelist_id) if codelist_id is not None else None
+    own_codes = {entry[0] for entry in own_entry["codes"]} if own_entry is not None else set()
 
-    unique_codes_set = set()
-    for code in code_set:
-        if code not in other_codes:
-            unique_codes_set.add(code)
+    other_codes_count = sum(1 for code, count in code_to_cl_count.items() if count > (code in own_codes))
+    if other_codes_count > unique_codes_count:
+        print(f"{codelist_id}: ERROR! Total number of codes in other codelists = ", other_codes_count)
+
+    unique_codes_set = {code for code in code_set if code_to_cl_count[code] <= (code in own_codes)}
 
     return code_set, common_code_set, unique_codes_set
 
 
+def _largest_codelists(df_code_lists, k):
+    """
+    Returns the k rows with the largest 'Total Codes', like ``nlargest(k, 'Total Codes')``.
+
+    For small k the candidates are selected with ``np.argpartition`` in O(N) and only those
+    k rows are sorted; ties are resolved in row order, as ``nlargest(keep='first')`` does.
+    """
+    vals = df_code_lists['Total Codes'].to_numpy()
+    if not 0 < k < len(vals) // 4:
+        return df_code_lists.nlargest(k, 'Total Codes')
+
+    # k-th largest value; every row above it is taken, rows equal to it in row order
+    threshold = vals[np.argpartition(-vals, k - 1)[k - 1]]
+    above = np.flatnonzero(vals > threshold)
+    at_threshold = np.flatnonzero(vals == threshold)[:k - len(above)]
+    idx = np.concatenate((above, at_threshold))
+    idx = idx[np.argsort(-vals[idx], kind='stable')]
+    return df_code_lists.iloc[idx]
+
+
 def tech_analisys(df_code_lists, df_codes, most_codelists_percent: int, most_frequent: int, n_times: int):
     """
     Performs several types of analysis on code lists based on provided DataFrames:
@@ -287,9 +504,9 @@ def tech_analisys(df_code_lists, df_codes, most_codelists_percent: int, most_fre
     >>> # and nonspecific codes occurring more than 10 times.
     """
     if most_codelists_percent in range(1, 101):
-        top_percent_codelists = df_code_lists.nlargest(
-            int(len(df_code_lists) * most_codelists_percent / 100),
-            'Total Codes'
+        top_percent_codelists = _largest_codelists(
+            df_code_lists[['CodelistID', 'Total Codes']],
+            int(len(df_code_lists) * most_codelists_percent / 100)
         )
         if most_codelists_percent == 100:
             print("\nCode lists:")
@@ -297,20 +514,24 @@ def tech_analisys(df_code_lists, df_codes, most_codelists_percent: int, most_fre
             print(f"\n{most_codelists_percent}% of the largest code lists:")
         print(top_percent_codelists[['CodelistID', 'Total Codes']])
 
+    # Counts stay on the object column: the order of equal counts in value_counts
+    # depends on the dtype, and it is part of the printed report
     if most_frequent > 0:
         most_frequent_top = df_codes['Code'].value_counts().head(most_frequent)
         print(f"\n{most_frequent} most frequent codes:")
         print(most_frequent_top.to_string(index=True, header=False))
 
-    # Helper function for nonspecific check
-    def is_nonspecific(code):
-        return (
-            isinstance(code, str)
-            and (code.isdigit() or (code.startswith('_') and any(c.isupper() for c in code[1:])))
-        )
-
-    df_codes['Code'] = df_codes['Code'].fillna('')   # Replace NaN with empty string
-    nonspecific_codes_series = df_codes[df_codes['Code'].apply(is_nonspecific)]['Code'].value_counts()
+    # Nonspecific check with vectorized string methods (NaN is treated as an empty string)
+    codes = df_codes['Code'].astype(CODE_DTYPE).fillna('')
+    underscored = codes.str.startswith('_', na=False)
+    rest = codes.str[1:]
+    has_upper = rest.str.contains('[A-Z]', regex=True, na=False)
+    # str.isupper() is Unicode-aware: check the rare non-ASCII codes one by one
+    non_ascii = underscored & rest.str.contains(r'[^\x00-\x7f]', regex=True, na=False)
+    if non_ascii.any():
+        has_upper[non_ascii] = rest[non_ascii].map(lambda r: any(c.isupper() for c in r)).astype(bool)
+    nonspecific_mask = codes.str.isdigit() | (underscored & has_upper)
+    nonspecific_codes_series = df_codes['Code'][nonspecific_mask.to_numpy(dtype=bool)].value_counts()
 
     # Keep only codes occurring more than n_times
     nonspecific_codes_series = nonspecific_codes_series[nonspecific_codes_series > n_times]
@@ -4,17 +4,40 @@
 
 # analyze_sdmx_cl.py
 import os
-import pandas as pd
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from .parse_save_cl import parse_codelist_v3, save_codelist_data
-from .analyze_func import tech_analisys, evaluate_code_uniqueness, analyze_groups
+from .analyze_func import tech_analisys, evaluate_code_uniqueness, analyze_groups, iter_unique_codelist_waves
 from .get_analyze_func import get_prefix_name_version, get_pref_ver_key
-from .analyze_templates import SINGLE_CODELISTS, GROUP_CODELISTS
+from .analyze_templates import SINGLE_CODELISTS, SINGLE_CODELISTS_SET, GROUP_CODELISTS, CL_TO_GROUP
 from .get_funcs import get_singles_template, get_scheme_id
-from .gen_template import SINGLES
+from .gen_template import concept_for
 from .download_xml_gr_cl import urn_to_sdmx_url
 
+# Strings that pandas.read_csv treats as NaN by default: a copy of
+# pandas.io.parsers.readers.STR_NA_VALUES as of pandas 2.2.3 (checked in tests/test_analyze_sdmx_cl.py)
+CSV_NA_VALUES = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null"
+})
 
-def cl_analysis(codelist_folder, all_cl_data_csv, cl_table_csv, filtered_cl_data_csv, filtered_cl_table_csv):
+
+def _mask_csv_na(df):
+    """Marks empty/NA-like values of df as missing, as they would be after re-reading it from a CSV file."""
+    return df.mask(df.isin(CSV_NA_VALUES) | df.isnull())
+
+
+def _parse_xml(xml_path):
+    """Worker of ``cl_analysis``: parses one XML file, returns (xml_path, result tuple or exception)."""
+    try:
+        return xml_path, parse_codelist_v3(xml_path)
+    except Exception as e:
+        return xml_path, e
+
+
+def cl_analysis(codelist_folder, all_cl_data_csv, cl_table_csv, filtered_cl_data_csv, filtered_cl_table_csv,
+                workers=None):
     """
      Main function for loading, analyzing, and filtering codelists,
      represented as SDMX XML files.
@@ -31,6 +54,9 @@ def cl_analysis(codelist_folder, all_cl_data_csv, cl_table_csv, filtered_cl_data
          Path to a CSV file where detailed data about codes after filtering will be saved.
      filtered_cl_table_csv : str
          Path to a CSV file with summary information about codelists after filtering.
+     workers : int, optional
+         Number of worker processes for parsing XML files
+         (default: ``os.cpu_count()``; 1 parses in the current process).
 
      Returns
      -------
@@ -40,7 +66,8 @@ def cl_analysis(codelist_folder, all_cl_data_csv, cl_table_csv, filtered_cl_data
      Notes
      -----
      1. The function recursively scans the directory `codelist_folder` for XML files.
-        For each file, `parse_codelist_v3` is called to extract the codelist structure.
+        For each file, `parse_codelist_v3` is called to extract the codelist structure
+        (files are parsed in a process pool; results are collected in directory order).
      2. Data is collected into the dictionary `codelists_data`, after which `save_codelist_data`
         is invoked to form two main DataFrames:
          - df_code_lists: metadata about codelists (summary table).
@@ -70,52 +97,64 @@ def cl_analysis(codelist_folder, all_cl_data_csv, cl_table_csv, filtered_cl_data
      """
     # 1. Build dictionary of CL with codes from XML files
     codelists_data = {}
-    for filename in os.listdir(codelist_folder):
-        xml_path = os.path.join(codelist_folder, filename)
-        if xml_path.endswith(".xml"):
-            try:
-                (codelist_id,
-                 codelist_name,
-                 agency,
-                 cl_id,
-                 ver,
-                 codelist_description,
-                 urn,
-                 codes) = parse_codelist_v3(xml_path)
-
-                url = urn_to_sdmx_url(urn)
-                if codelist_id and codes:
-                    codelists_data[codelist_id] = {
-                        "name": codelist_name,
-                        "agency": agency,
-                        "clid": cl_id,
-                        "ver": ver,
-                        "description": codelist_description,
-                        "codes": codes,
-                        "simcl": "",
-                        "url": url
-                    }
-            except Exception as e:
-                print(f"Error while processing {xml_path}: {e}")
-                continue
+    with os.scandir(codelist_folder) as it:
+        xml_paths = [entry.path for entry in it if entry.name.endswith(".xml") and entry.is_file()]
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(xml_paths) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            parsed = list(ex.map(_parse_xml, xml_paths, chunksize=16))
+    else:
+        parsed = map(_parse_xml, xml_paths)
+
+    for xml_path, result in parsed:
+        try:
+            if isinstance(result, Exception):
+                raise result
+            (codelist_id,
+             codelist_name,
+             agency,
+             cl_id,
+             ver,
+             codelist_description,
+             urn,
+             codes) = result
+
+            url = urn_to_sdmx_url(urn)
+            # Intern code values: equal codes of different codelists (e.g. "_Z", "1") share
+            # one str object, so set operations on them compare by identity first
+            codes = [(sys.intern(code), description) for code, description in codes]
+            if codelist_id and codes:
+                codelists_data[codelist_id] = {
+                    "name": codelist_name,
+                    "agency": agency,
+                    "clid": cl_id,
+                    "ver": ver,
+                    "description": codelist_description,
+                    "codes": codes,
+                    "simcl": "",
+                    "url": url
+                }
+        except Exception as e:
+            print(f"Error while processing {xml_path}: {e}")
+            continue
 
     print("Codelists successfully loaded. Starting table generation.\n")
 
     # Identify "similar" codelists (same name, different version)
     codelist_names = {cl_id: get_prefix_name_version(cl_id)[2] for cl_id in codelists_data.keys()}
+    # Inverted index name -> codelists (in codelists_data order)
+    name_to_cls = defaultdict(list)
+    for cl_id, cl_name in codelist_names.items():
+        name_to_cls[cl_name].append(cl_id)
     for codelist_id, data in codelists_data.items():
-        extracted_name = get_prefix_name_version(codelist_id)[2]
-        if extracted_name is None:
+        extracted_name = codelist_names[codelist_id]
+        if extracted_name is None or len(name_to_cls[extracted_name]) < 2:
             data["simcl"] = None
             continue
-        similar = [
-            clid for clid, clname in codelist_names.items()
-            if clid != codelist_id and clname == extracted_name
-        ]
-        if similar:
-            similar.append(codelist_id)
-            similar = sorted(similar, key=get_pref_ver_key)
-        data["simcl"] = similar if similar else None
+        # Other codelists first, then the current one (keeps the order of ties in the stable sort)
+        similar = [clid for clid in name_to_cls[extracted_name] if clid != codelist_id]
+        similar.append(codelist_id)
+        data["simcl"] = sorted(similar, key=get_pref_ver_key)
 
     # Print lists of similar codelists
     unique_simcl_set = set()
@@ -141,7 +180,6 @@ def cl_analysis(codelist_folder, all_cl_data_csv, cl_table_csv, filtered_cl_data
     print("\n2. Excluding group and unique codelists from analysis")
 
     group_codelists = []
-    group_codelists_dict = {}
     for group_id, group in GROUP_CODELISTS.items():
         if "codelists" in group:
             codelists = group["codelists"]
@@ -149,51 +187,49 @@ def cl_analysis(codelist_folder, all_cl_data_csv, cl_table_csv, filtered_cl_data
                 print(f"Duplicate names in {group_id}")
             uniq_codelists = list(set(codelists))
             group_codelists.extend(uniq_codelists)
-            group_codelists_dict[group_id] = uniq_codelists
 
-    single_codelists = []
-    dubl_single_codelists = []
-    for single_codelist in SINGLE_CODELISTS:
-        if len(single_codelists) == 0:
-            single_codelists.append(single_codelist)
-        else:
-            if single_codelist in single_codelists:
-                dubl_single_codelists.append(single_codelist)
-            else:
-                single_codelists.append(single_codelist)
+    # Order-preserving dedup (first occurrences) and repeated occurrences, in linear time
+    single_codelists = list(dict.fromkeys(SINGLE_CODELISTS))
+    seen_single_codelists = set()
+    dubl_single_codelists = [
+        single_codelist for single_codelist in SINGLE_CODELISTS
+        if single_codelist in seen_single_codelists or seen_single_codelists.add(single_codelist)
+    ]
     if len(dubl_single_codelists) > 0:
         print("Duplicates found in SINGLE_CODELISTS:")
         for dublicate in dubl_single_codelists:
             print(dublicate)
 
-    excluded_codelists = single_codelists + group_codelists
+    # Excluded codelists are maintained as a set
+    labeled_codelists = set(SINGLE_CODELISTS_SET)
+    labeled_codelists.update(group_codelists)
+    excluded_set = set(labeled_codelists)
     print("Excluded codelists from SINGLE_CODELISTS:", len(single_codelists))
     print("Excluded codelists from GROUP_CODELISTS:", len(group_codelists))
     print("\nAutomatically excluding codelists with unique codes")
 
+    # Codelists with 'Shared Codes' == 0 in the full table; removing them can leave
+    # further codelists without shared codes, which are excluded wave by wave
     df_filtered_code_lists = []
-    total_filtered_codelists = []
-    while True:
-        # Find codelists with 'Shared Codes' == 0
-        if len(df_filtered_code_lists) == 0:
-            filtered_codelists = df_code_lists[df_code_lists['Shared Codes'] == 0]['CodelistID'].tolist()
-        else:
-            filtered_codelists = df_filtered_code_lists[df_filtered_code_lists['Shared Codes'] == 0]['CodelistID'].tolist()
-
-        # Exclude already excluded
-        f_cl = set(filtered_codelists) - set(excluded_codelists)
-        if len(f_cl) == 0:
-            break
-
+    filtered_codelists = df_code_lists[df_code_lists['Shared Codes'] == 0]['CodelistID'].tolist()
+    f_cl = set(filtered_codelists).difference(excluded_set)
+    if len(f_cl) > 0:
         print(f"\nExcluding codelists ({len(f_cl)})")
-        excluded_codelists = list(set(excluded_codelists + filtered_codelists))
+        excluded_set |= f_cl
+
+        remaining_codelists_data = {
+            codelist_id: data for codelist_id, data in codelists_data.items()
+            if codelist_id is not None and codelist_id not in excluded_set
+        }
+        for wave in iter_unique_codelist_waves(remaining_codelists_data, common_codes):
+            print(f"\nExcluding codelists ({len(wave)})")
+            excluded_set.update(wave)
 
         # Create new dictionary without excluded codelists
-        filtered_codelists_data = {}
-        for codelist_id, data in codelists_data.items():
-            if codelist_id is None or codelist_id in excluded_codelists:
-                continue
-            filtered_codelists_data[codelist_id] = data
+        filtered_codelists_data = {
+            codelist_id: data for codelist_id, data in remaining_codelists_data.items()
+            if codelist_id not in excluded_set
+        }
 
         filtered_common_codes, df_filtered_code_lists, df_filtered_codes = save_codelist_data(
             filtered_codelists_data,
@@ -202,19 +238,14 @@ def cl_analysis(codelist_folder, all_cl_data_csv, cl_table_csv, filtered_cl_data
             save_flag=False
         )
 
-    total_filtered_codelists = excluded_codelists.copy()
-    for item in single_codelists + group_codelists:
-        if item in total_filtered_codelists:
-            total_filtered_codelists.remove(item)
-
+    total_filtered_codelists = sorted(excluded_set - labeled_codelists)
     if len(total_filtered_codelists) > 0:
         print(f"\nAutomatically excluded codelists with unique codes ({len(total_filtered_codelists)}):")
-        total_filtered_codelists.sort()
         for f_codelist in total_filtered_codelists:
             print(f_codelist)
 
+    excluded_codelists = sorted(excluded_set)
     print(f"\nTotal excluded codelists - ({len(excluded_codelists)})")
-    excluded_codelists.sort()
     print("------------------------------------------------")
 
     # Count remaining codelists
@@ -222,18 +253,22 @@ def cl_analysis(codelist_folder, all_cl_data_csv, cl_table_csv, filtered_cl_data
     print(f"\n3. Technical analysis (unlabeled codelists - {cl_count})")
 
     # Update GroupType and SchemeID fields in df_code_lists for group and single CL
-    for group_id, codelists in group_codelists_dict.items():
-        for codelist_id in codelists:
-            df_code_lists.loc[df_code_lists['CodelistID'] == codelist_id, 'GroupType'] = "GROUP"
-            df_code_lists.loc[df_code_lists['CodelistID'] == codelist_id, 'SchemeID'] = str(group_id)
-    for codelist_id in (set(excluded_codelists) - set(group_codelists)):
-        df_code_lists.loc[df_code_lists['CodelistID'] == codelist_id, 'GroupType'] = "SINGLE"
-        for short_name, value in SINGLES.items():
-            if value["codelist"] == codelist_id:
-                df_code_lists.loc[df_code_lists['CodelistID'] == codelist_id, 'SchemeID'] = str(short_name)
+    # (one vectorized map per column instead of a DataFrame scan per codelist)
+    single_excluded_codelists = excluded_set.difference(CL_TO_GROUP)
+    group_type_map = dict.fromkeys(CL_TO_GROUP, "GROUP")
+    group_type_map.update(dict.fromkeys(single_excluded_codelists, "SINGLE"))
+    # Scheme of group codelists, then (via the SINGLES reverse index) of single ones
+    scheme_map = {codelist_id: str(group_id) for codelist_id, group_id in CL_TO_GROUP.items()}
+    for codelist_id in single_excluded_codelists:
+        short_name = concept_for(codelist_id)
+        if short_name is not None:
+            scheme_map[codelist_id] = str(short_name)
+    df_code_lists['GroupType'] = df_code_lists['CodelistID'].map(group_type_map).fillna(df_code_lists['GroupType'])
+    df_code_lists['SchemeID'] = df_code_lists['CodelistID'].map(scheme_map).fillna(df_code_lists['SchemeID'])
 
     df_code_lists.to_csv(cl_table_csv, index=False, sep=";")
-    df_code_lists = pd.read_csv(cl_table_csv, sep=";")
+    # Treat empty/NA-like values as missing, as they would be after re-reading the saved CSV
+    df_code_lists = _mask_csv_na(df_code_lists)
     print(f"\nnFile {cl_table_csv} successfully saved.")
 
     # Check for missing values
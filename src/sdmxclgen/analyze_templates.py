@@ -76,3 +76,12 @@ GROUP_CODELISTS = {
     "itemStocks": {"name": "Items of Stocks, Transactions and Other Flows", "codelists": ["IMF:CL_ACCOUNTS_ITEM(1.8.0)", "ESTAT:CL_SEEA_STO(1.2)",
                                                             "IMF:CL_FSENTRY(1.1)"]}
 }
+
+# Lookup structures for membership tests (O(1) instead of list scans)
+SINGLE_CODELISTS_SET = frozenset(SINGLE_CODELISTS)
+# Codelist -> group identifier (a codelist listed in several groups maps to the last one)
+CL_TO_GROUP = {
+    cl: group_id
+    for group_id, group in GROUP_CODELISTS.items() if "codelists" in group
+    for cl in group["codelists"]
+}
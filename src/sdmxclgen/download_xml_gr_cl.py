@@ -2,10 +2,86 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright (c) 2025 Semantic R&D Group
 
-import requests
+import hashlib
+import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
+
+# Shared HTTP session: reuses TCP/TLS connections across (parallel) downloads
+# and retries transient failures (the last response is returned, not raised)
+POOL_SIZE = 32
+RETRY = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=RETRY)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+SESSION.headers["Accept-Encoding"] = "gzip, deflate"
+
+# Chunk size for streaming response bodies to disk
+CHUNK_SIZE = 1 << 16
+
+# Name of the download manifest (url -> {file, etag, size, sha256})
+MANIFEST_NAME = "_manifest.json"
+
+# Codelist URN: agency, id and version
+_URN_RE = re.compile(r"urn:sdmx:org\.sdmx\.infomodel\.codelist\.Codelist=([^:]+):([^()]+)\(([\d.]+)\)")
+
+
+def load_manifest(manifest_path):
+    """
+    Loads the download manifest, or returns an empty one if it is missing or unreadable.
+
+    Parameters
+    ----------
+    manifest_path : str or pathlib.Path
+        Path to the JSON manifest file.
+
+    Returns
+    -------
+    dict
+        Mapping ``url -> {"file", "etag", "size", "sha256"}``.
+    """
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(manifest, manifest_path):
+    """
+    Saves the download manifest as JSON.
+
+    Parameters
+    ----------
+    manifest : dict
+        Mapping ``url -> {"file", "etag", "size", "sha256"}``.
+    manifest_path : str or pathlib.Path
+        Path to the JSON manifest file.
+    """
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
 
-def download_xml(url, filename):
+
+def _cached_entry(manifest, url, filename):
+    """Returns the manifest entry for url if the local file still matches it, otherwise None."""
+    entry = manifest.get(url) if manifest is not None else None
+    if (
+        entry
+        and entry.get("etag")
+        and entry.get("file") == os.path.basename(filename)
+        and os.path.exists(filename)
+        and os.path.getsize(filename) == entry.get("size")
+    ):
+        return entry
+    return None
+
+def download_xml(url, filename, manifest=None):
     """
     Function for downloading an XML file from a given URL and saving it to a local file.
 
@@ -15,6 +91,10 @@ def download_xml(url, filename):
         The link to the XML file to download.
     filename : str
         The name of the local file where the downloaded content will be saved.
+    manifest : dict, optional
+        Download manifest (see ``load_manifest``). If given, an unchanged
+        file (HTTP 304 for its stored ETag) is not downloaded again, and
+        the entry for url is updated after a successful download.
 
     Returns
     -------
@@ -29,8 +109,14 @@ def download_xml(url, filename):
 
     Notes
     -----
-    1. Uses the `requests.get` method for downloading.
-    2. On failure, prints an error message to the console.
+    1. Uses the shared module-level `SESSION` (connection pool of `POOL_SIZE`,
+       retries per `RETRY`) for downloading, so it is safe to call from a thread pool.
+    2. The body is streamed to disk in `CHUNK_SIZE` blocks with ``iter_content``
+       (gzip/deflate transfer encoding is decoded on the fly), so memory use is bounded.
+    3. With a manifest, a conditional request (``If-None-Match``) is sent
+       when the local file matches the stored entry; on 304 nothing is written.
+    4. On failure, prints an error message to the console and removes
+       a partially written file.
 
     Examples
     --------
@@ -38,17 +124,70 @@ def download_xml(url, filename):
     >>> print(success)
     True
     """
+    entry = _cached_entry(manifest, url, filename)
+    headers = {"If-None-Match": entry["etag"]} if entry else None
+    written = False
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        with open(filename, "wb") as f:
-            f.write(response.content)
+        with SESSION.get(url, timeout=10, stream=True, headers=headers) as response:
+            if entry and response.status_code == 304:
+                return True
+            response.raise_for_status()
+            sha256 = hashlib.sha256()
+            size = 0
+            with open(filename, "wb") as f:
+                written = True
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    sha256.update(chunk)
+                    f.write(chunk)
+                    size += len(chunk)
+            etag = response.headers.get("ETag")
+        if manifest is not None:
+            manifest[url] = {
+                "file": os.path.basename(filename),
+                "etag": etag,
+                "size": size,
+                "sha256": sha256.hexdigest(),
+            }
         return True
-    except requests.RequestException as e:
+    except (requests.RequestException, Urllib3HTTPError, OSError) as e:
         print(f"Download error {url}: {e}")
+        if written and os.path.exists(filename):
+            os.remove(filename)
         return False
 
 
+def download_xml_many(pairs, max_workers=POOL_SIZE, manifest=None):
+    """
+    Downloads many XML files in parallel with ``download_xml``.
+
+    Parameters
+    ----------
+    pairs : iterable of tuple
+        Pairs ``(url, filename)`` to download.
+    max_workers : int
+        Number of download threads (default: `POOL_SIZE`, the size of the session connection pool).
+    manifest : dict, optional
+        Download manifest shared by all downloads (see ``download_xml``).
+
+    Returns
+    -------
+    list of bool
+        Result of ``download_xml`` for each pair, in input order.
+
+    Notes
+    -----
+    Downloads are network-bound, so threads overlap the waiting on the shared `SESSION`
+    (the GIL is released during I/O).
+
+    Examples
+    --------
+    >>> download_xml_many([("https://example.com/a.xml", "a.xml"), ("https://example.com/b.xml", "b.xml")])
+    [True, True]
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        return list(ex.map(lambda pair: download_xml(pair[0], pair[1], manifest), pairs))
+
+
 def urn_to_sdmx_url(urn):
     """
     Converts an SDMX-style URN string into a URL for the SDMX REST API.
@@ -81,8 +220,7 @@ def urn_to_sdmx_url(urn):
     >>> print(urn_to_sdmx_url(urn_example))
     https://registry.sdmx.org/sdmx/v2/structure/codelist/ESTAT/CL_COVERAGE_POP/1.1.0
     """
-    pattern = r"urn:sdmx:org\.sdmx\.infomodel\.codelist\.Codelist=([^:]+):([^()]+)\(([\d.]+)\)"
-    match = re.match(pattern, urn)
+    match = _URN_RE.match(urn)
 
     if not match:
         raise ValueError("Invalid URN format")
@@ -125,7 +263,7 @@ def get_sdmx_object(urn):
     """
     url = urn_to_sdmx_url(urn)
     print(f"Requesting URL: {url}")
-    response = requests.get(url, headers={"Accept": "application/xml"})
+    response = SESSION.get(url, headers={"Accept": "application/xml"})
     if response.status_code == 200:
         return response.text
     else:
@@ -3,7 +3,13 @@
 # Copyright (c) 2025 Semantic R&D Group
 
 # gen_cl_ttl.py
+import os
+from collections import defaultdict
 from datetime import date
+from itertools import islice
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 import pandas as pd
 from .templates import SDMX_ConceptSchemes, SDMX_PREF_CODE, SDMX_CODE_URI
 from .gen_template import NEW_PREF, NEW_PURL, NEW_PREF_CODE, NEW_PURL_CODE, PREF_COM_SET
@@ -14,7 +20,26 @@ from .get_funcs import (
     get_scheme_dict,
     get_from_scheme_dict
 )
-from .quality_check import check_rdf_quality
+from .quality_check import check_rdf_quality_cached
+
+# Columns of the CSV tables consumed by the generation (see get_scheme_dict, get_code_description_dict)
+CL_TABLE_USECOLS = ["CodelistID", "SchemeID", "CL Name", "Codelist Description", "URL"]
+CL_DATA_USECOLS = ["CodelistID", "Agency", "Code", "Code Description"]
+
+# Buffer size for writing TTL files
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Additional prefixes of scheme files (depend only on module constants)
+_PREF_CL = {
+    "sdmx-concept": "http://purl.org/linked-data/sdmx/2009/concept#",
+    f"{SDMX_PREF_CODE}": f"{SDMX_CODE_URI}",
+    f"{NEW_PREF}-concept": f"{NEW_PURL}/concept/",
+    f"{NEW_PREF_CODE}": f"{NEW_PURL_CODE}",
+    f"{NEW_PREF}": f"{NEW_PURL}"
+}
+
+# Blank node with the agencies that share one code label
+_AGENCY_LABEL_TMPL = f'[{NEW_PREF}-agency:agenciesID {{agencies}} ; rdfs:label """{{label}}"""@en ]'
 
 def generation_ttl(in_dict, in_scheme_dict, output_file, concept_scheme: str):
     """
@@ -46,7 +71,8 @@ def generation_ttl(in_dict, in_scheme_dict, output_file, concept_scheme: str):
     2. Calls ``get_concept_scheme_str`` to form the main part of the TTL file about the scheme (ConceptScheme).
     3. For each code (code, agencies), generates SKOS concept blocks using ``get_concept_str``.
     4. If a code has multiple agencies, additional structures are generated for their description.
-    5. Writes the final TTL file.
+    5. Writes the TTL file incrementally: prefixes and the scheme block first, then each concept
+       as it is generated.
 
     Examples
     --------
@@ -61,17 +87,9 @@ def generation_ttl(in_dict, in_scheme_dict, output_file, concept_scheme: str):
     conceptscheme_name = concept_scheme.split(":")[-1]
     sdmx_conceptscheme_name = f"{SDMX_PREF_CODE}:{conceptscheme_name}"
 
-    # Additional prefixes
-    pref_cl = {
-        "sdmx-concept": "http://purl.org/linked-data/sdmx/2009/concept#",
-        f"{SDMX_PREF_CODE}": f"{SDMX_CODE_URI}",
-        f"{NEW_PREF}-concept": f"{NEW_PURL}/concept/",
-        f"{NEW_PREF_CODE}": f"{NEW_PURL_CODE}",
-        f"{NEW_PREF}": f"{NEW_PURL}"
-    }
-
-    # Merge common prefix set
-    prefixes = PREF_COM_SET | pref_cl
+    # Merge common prefix set with the additional prefixes (in place, one dict per call)
+    prefixes = dict(PREF_COM_SET)
+    prefixes.update(_PREF_CL)
 
     # Get part with ConceptScheme description
     concept_scheme_str, label_n3, description_concept_n3 = get_concept_scheme_str(
@@ -81,46 +99,19 @@ def generation_ttl(in_dict, in_scheme_dict, output_file, concept_scheme: str):
     )
 
     # Title for code block
-    concepts = []
     concepts_title = f"""
 ########################################
 # CL_{conceptscheme_name.upper()} Codes
 ########################################
     """
-    concepts.append(concepts_title)
 
     # UPD. Check for codes with multiple agencies
     # agencies_fl = False
     agencies_fl = any(len(agencies) > 1 for agencies in in_dict.values())
 
-    for code, agencies in in_dict.items():
-        agency_labels = []
-
-        # UPD. If codes with multiple agencies are present, form Blank nodes
-        # if len(agencies) > 1:
-        if agencies_fl:
-
-            agency_label_groups = {}
-            for agency in agencies:
-                agency_description = agency['codeDescription']
-                if agency_description not in agency_label_groups:
-                    agency_label_groups[agency_description] = []
-                agency_label_groups[agency_description].append(f"{NEW_PREF}-agency:{agency['agencyID']}")
-
-            for label, agency_list in agency_label_groups.items():
-                agency_group = ", ".join(agency_list)
-                agency_labels.append(
-                    f"[{NEW_PREF}-agency:agenciesID {agency_group} ; "
-                    f'rdfs:label """{label}"""@en ]'
-                )
-
-        # Generate block of a specific concept (code)
-        concept = get_concept_str(conceptscheme_name, code, agencies, agency_labels)
-        concepts.append(concept)
-
     # If codes with multiple agencies are present, add corresponding prefix
     if agencies_fl:
-        prefixes |=  {f"{NEW_PREF}-agency":f"{NEW_PURL}/agency/"}
+        prefixes[f"{NEW_PREF}-agency"] = f"{NEW_PURL}/agency/"
 
     # Form prefix text
     prefixes_str = "\n".join(
@@ -128,16 +119,80 @@ def generation_ttl(in_dict, in_scheme_dict, output_file, concept_scheme: str):
         for key, value in prefixes.items()
     ) + "\n\n"
 
-    # Write to file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(prefixes_str)
-        f.write(concept_scheme_str)
-        f.write("\n".join(concepts))
+    # Write to file: the header first, then each concept as soon as it is generated
+    # (through a 1 MiB buffer), so the whole TTL text is never held in memory
+    with open(output_file, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        f.write("".join((prefixes_str, concept_scheme_str, concepts_title)).encode('utf-8'))
+
+        for code, agencies in in_dict.items():
+            agency_labels = []
+
+            # UPD. If codes with multiple agencies are present, form Blank nodes
+            # if len(agencies) > 1:
+            if agencies_fl and len(agencies) == 1:
+                # Single-agency code in a multi-agency scheme: one label, no grouping needed
+                agency = agencies[0]
+                agency_labels = [
+                    _AGENCY_LABEL_TMPL.format(agencies=f"{NEW_PREF}-agency:{agency['agencyID']}",
+                                              label=agency['codeDescription'])
+                ]
+            elif agencies_fl:
+
+                agency_label_groups = defaultdict(list)
+                for agency in agencies:
+                    agency_label_groups[agency['codeDescription']].append(f"{NEW_PREF}-agency:{agency['agencyID']}")
+
+                agency_labels = [
+                    _AGENCY_LABEL_TMPL.format(agencies=", ".join(agency_list), label=label)
+                    for label, agency_list in agency_label_groups.items()
+                ]
+
+            # Generate block of a specific concept (code), separated by a newline as before
+            concept = get_concept_str(conceptscheme_name, code, agencies, agency_labels)
+            f.write(("\n" + concept).encode('utf-8'))
 
     return label_n3, description_concept_n3, agencies_fl
 
 
-def sdmx_codelist_gen(cl_table_csv, cl_data_csv, out_dir):
+def _gen_one(concept_scheme, df_scheme, df_scheme_codes, out_dir):
+    """
+    Generates and checks the TTL file of one scheme (worker of ``sdmx_codelist_gen``).
+
+    Parameters
+    ----------
+    concept_scheme : str
+        Scheme identifier (value of the SchemeID column).
+    df_scheme : pandas.DataFrame
+        Rows of the codelist table that belong to the scheme.
+    df_scheme_codes : pandas.DataFrame
+        Rows of the code table that belong to the scheme codelists.
+    out_dir : pathlib.Path
+        Directory where the TTL file is written.
+
+    Returns
+    -------
+    tuple
+        (output_file, scheme_name, label_n3, description_concept_n3, agencies_fl, quality_report).
+    """
+    scheme_description_dict = get_scheme_dict(df_scheme, concept_scheme)
+    _, _, codelists, _ = get_from_scheme_dict(scheme_description_dict, concept_scheme)
+    code_description_dict = get_code_description_dict(df_scheme_codes, codelists)
+
+    scheme_name = concept_scheme.split(":")[-1]
+    output_file = str(out_dir / f"{NEW_PREF}-code-{scheme_name}.ttl")
+
+    label_n3, description_concept_n3, agencies_fl = generation_ttl(
+        code_description_dict,
+        scheme_description_dict,
+        output_file,
+        concept_scheme
+    )
+    # Check quality of generated TTL
+    result = check_rdf_quality_cached(output_file)
+    return output_file, scheme_name, label_n3, description_concept_n3, agencies_fl, result
+
+
+def sdmx_codelist_gen(cl_table_csv, cl_data_csv, out_dir, workers=None):
     """
     Creates a set of Turtle files (one for each codelist), as well as a general code.ttl
     file with summary information about all codelists.
@@ -148,8 +203,11 @@ def sdmx_codelist_gen(cl_table_csv, cl_data_csv, out_dir):
         CSV file with summary information about codelists (e.g., label, version, scheme identifier).
     cl_data_csv : str
         CSV file with detailed code data.
-    out_dir : str
+    out_dir : str or pathlib.Path
         Directory where generated Turtle files will be saved.
+    workers : int, optional
+        Number of worker processes for generating scheme files
+        (default: ``os.cpu_count()``; 1 runs in the current process).
 
     Returns
     -------
@@ -160,7 +218,11 @@ def sdmx_codelist_gen(cl_table_csv, cl_data_csv, out_dir):
     -----
     1. Loads two CSVs (df_code_lists and df_codes), forms a general file code.ttl.
     2. For each unique SchemeID, creates a separate TTL file using the function generation_ttl.
-    3. After creating each file, calls check_rdf_quality to assess the quality of the RDF model.
+       Schemes are independent, so they are dispatched to a process pool; each worker
+       receives only the rows of its scheme and its codelists.
+    3. After creating each file, calls check_rdf_quality (through check_rdf_quality_cached,
+       so unchanged files are not re-parsed on later runs) to assess the quality of the RDF model.
+       Results are reported in scheme order.
     4. The final code.ttl file contains a summary (skos:ConceptScheme) of all existing codelists.
 
     Examples
@@ -169,9 +231,14 @@ def sdmx_codelist_gen(cl_table_csv, cl_data_csv, out_dir):
     # Generates files like ./out_ttl/new-code-CL_COVERAGE_POP.ttl and ./out_ttl/code.ttl,
     # performs RDF quality check (quality_score).
     """
+    out_dir = Path(out_dir)
+
     # Load CSV into DataFrames
-    df_code_lists = pd.read_csv(cl_table_csv, sep=";", dtype=str, keep_default_na=False)
-    df_codes = pd.read_csv(cl_data_csv, sep=";", dtype=str, keep_default_na=False)
+    # (C parser, only the consumed columns are parsed and materialized)
+    df_code_lists = pd.read_csv(cl_table_csv, sep=";", dtype=str, keep_default_na=False,
+                                usecols=CL_TABLE_USECOLS, engine="c", low_memory=False)
+    df_codes = pd.read_csv(cl_data_csv, sep=";", dtype=str, keep_default_na=False,
+                           usecols=CL_DATA_USECOLS, engine="c", low_memory=False)
 
     # list of codelists with multiple agencies
     has_agency_label_ttls = []
@@ -196,56 +263,56 @@ def sdmx_codelist_gen(cl_table_csv, cl_data_csv, out_dir):
         "\n# CODE LISTS\n"
     ]
 
-    # Initial text of code.ttl
-    code_str = "\n".join(
+    # Initial text of code.ttl; scheme blocks are appended as parts and joined once
+    code_parts = ["\n".join(
         f"@prefix {key}: <{value}> ."
         for key, value in code_prefixes.items()
-    ) + "\n " + "".join(code_scheme)
-
-    from itertools import islice
+    ) + "\n " + "".join(code_scheme)]
 
     # For each unique SchemeID create a separate TTL
-    # (limited to 1000 schemes via islice, by default — for demonstration)
+    # (limited to 1000 schemes via islice, by default — for demonstration).
+    # Group both tables once, so each task carries only its own slices
+    schemes_df = df_code_lists.groupby("SchemeID", sort=False)
+    # Row positions of each codelist in the codes table (one hash pass over CodelistID)
+    code_rows_by_cl = df_codes.groupby("CodelistID", sort=False).indices
+    tasks = []
     for concept_scheme in islice(df_code_lists["SchemeID"].unique(), 1000):
-        scheme_description_dict = get_scheme_dict(df_code_lists, concept_scheme)
-        _, _, codelists, _ = get_from_scheme_dict(scheme_description_dict, concept_scheme)
-        code_description_dict = get_code_description_dict(df_codes, codelists)
-
-        scheme_name = concept_scheme.split(":")[-1]
-        output_file = f"{str(out_dir)}/{NEW_PREF}-code-{scheme_name}.ttl"
-
-        label_n3, description_concept_n3, agencies_fl = generation_ttl(
-            code_description_dict,
-            scheme_description_dict,
-            output_file,
-            concept_scheme
-        )
+        df_scheme = schemes_df.get_group(concept_scheme)
+        code_rows = [code_rows_by_cl[cl] for cl in df_scheme["CodelistID"].unique() if cl in code_rows_by_cl]
+        # One positional take, in the original row order of the codes table
+        rows = np.sort(np.concatenate(code_rows)) if code_rows else np.empty(0, dtype=np.intp)
+        tasks.append((concept_scheme, df_scheme, df_codes.iloc[rows], out_dir))
+
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(tasks) > 1:
+        workers = min(workers, len(tasks))
+        # Tasks are sent in batches (a few per worker) to cut inter-process round trips
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(_gen_one, *zip(*tasks), chunksize=chunksize))
+    else:
+        results = [_gen_one(*task) for task in tasks]
+
+    for task, (output_file, scheme_name, label_n3, description_concept_n3, agencies_fl, result) in zip(tasks, results):
+        concept_scheme = task[0]
         # if codelist has multiple agencies, add to the list
         if agencies_fl:
             has_agency_label_ttls.append((output_file, label_n3))
         # Add to summary code.ttl
-        code_ttl_cl = (
+        code_parts.append(
             f"\n{NEW_PREF_CODE}:{concept_scheme} a skos:ConceptScheme ;\n"
             f"    rdfs:label {label_n3}@en ;\n"
         )
         if len(description_concept_n3) > 0:
-            code_ttl_cl += f"    dct:description {description_concept_n3}"
-        code_ttl_cl += f"    dct:source <{NEW_PURL}/code/{scheme_name}> .\n"
-
-        code_str += code_ttl_cl
+            code_parts.append(f"    dct:description {description_concept_n3}")
+        code_parts.append(f"    dct:source <{NEW_PURL}/code/{scheme_name}> .\n")
 
-        # Check quality of generated TTL
+        # Quality of generated TTL
         print(f"\n{output_file}")
-        result = check_rdf_quality(output_file)
         # Extract quality_score_10 and value_score_10
         quality_score_10 = result.get("quality_score_10")
         value_score_10 = result.get("value_score_10")
 
-        # Form CSV file of codelists with multiple agencies
-        df_agency_labels = pd.DataFrame(has_agency_label_ttls, columns=["TTL File", "ConceptScheme Label"])
-        df_agency_labels["ConceptScheme Label"] = df_agency_labels["ConceptScheme Label"].str.strip('"')
-        df_agency_labels.to_csv(f"codelists_with_hasAgencyLabel.csv", index=False)
-
         # If scores are high, print short message, otherwise full report
         if (quality_score_10 and value_score_10) and (quality_score_10 > 9.5 and value_score_10 > 9.5):
             print(f"quality_score_10: {quality_score_10}\nvalue_score_10: {value_score_10}")
@@ -253,10 +320,15 @@ def sdmx_codelist_gen(cl_table_csv, cl_data_csv, out_dir):
             for key, value in result.items():
                 print(f"{key}: {value}")
 
+    # Form CSV file of codelists with multiple agencies (once, after all schemes)
+    df_agency_labels = pd.DataFrame(has_agency_label_ttls, columns=["TTL File", "ConceptScheme Label"])
+    df_agency_labels["ConceptScheme Label"] = df_agency_labels["ConceptScheme Label"].str.strip('"')
+    df_agency_labels.to_csv("codelists_with_hasAgencyLabel.csv", index=False)
+
     # Create/overwrite general code.ttl
-    file_name = f"{str(out_dir)}/code.ttl"
-    with open(file_name, 'w', encoding='utf-8') as f:
-        f.write(code_str)
+    file_name = str(out_dir / "code.ttl")
+    with open(file_name, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        f.write("".join(code_parts).encode('utf-8'))
 
     # Check quality of general code.ttl
-    _ = check_rdf_quality(file_name)
+    _ = check_rdf_quality_cached(file_name)
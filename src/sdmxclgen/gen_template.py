@@ -4,8 +4,14 @@
 
 # gen_template.py
 
+import json
+import sys
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import NamedTuple
 from rdflib import Namespace
-from src.sdmxclgen.templates import DCTERMS, SDMX_CONCEPT
+from src.sdmxclgen.templates import DCTERMS, SDMX_CONCEPT, DESCRIPTION_NA
 
 # Base URIs and prefixes for the new model
 NEW_PREF = "sip-sdmx"
@@ -22,385 +28,112 @@ PREF_COM_SET = {
     "sdmx": "http://purl.org/linked-data/sdmx#",
 }
 
-# The SINGLES dictionary contains descriptions of concepts and corresponding codelists
-# Format:
-# key — short name of the concept;
-# value — dictionary with fields:
+# The SINGLES table contains descriptions of concepts and corresponding codelists.
+# The records are stored in SINGLES_FILE (JSON list) and loaded on first use;
+# SINGLES and the lookup views below are built from them on first access.
+# Record format:
+#     - key (str): short name of the concept
 #     - codelist (str): link to SDMX/agency codelist
 #     - label (str): human-readable name of the concept
-#     - description (str): description of the concept, if available
-SINGLES = {
-        "levCounterpart": {
-            "codelist": "OECD:CL_LEV_COUNTERPART(1.0)",
-            "label": "Level of counterpart code list",
-            "description": """Description not available"""
-        },
-        "freq": {
-            "codelist": "SDMX:CL_FREQ(2.1)",
-            "label": "Code list for concept \"Frequency\"",
-            "description": """This code list provides a set of values indicating the
- "frequency" of the data (e.g. weekly, monthly, quarterly). The concept "frequency" may
- refer to various stages in the production process, e.g. data collection or data
- dissemination. For example, a time series could be disseminated at annual frequency but
- the underlying data are compiled monthly. The code list is applicable for all different
- uses of "frequency"."""
-        },
-        "decimals": {
-            "codelist": "SDMX:CL_DECIMALS(1.0)",
-            "label": "Decimals",
-            "description": """This code list provides a list of values showing the number of decimal digits used in the
- data. This code list was released in 2009. More information about this code list and SDMX code lists in general (e.g.
- list of generic codes for expressing general concepts like "Total", "Unknown", etc.; syntaxes for the creation of
- further codes; general guidelines for the creation of SDMX code lists) can be found at this address:
- https://sdmx.org/?page_id=4345."""
-        },
-        "pensFundType": {
-            "codelist": "ESTAT:CL_PENS_FUNDTYPE(1.2)",
-            "label": "Pension Fund Type",
-            "description": """Description not available"""
-        },
-        "compilingOrg": {
-            "codelist": "IMF:CL_ORGANISATION(1.14.0)",
-            "label": "Compiling organisation code list",
-            "description": """Description not available"""
-        },
-        "accountEntry": {
-            "codelist": "IMF:CL_ACCOUNT_ENTRY(1.5.0)",
-            "label": "Accounting entry code list",
-            "description": """Description not available"""
-        },
-        "timeFormat": {
-            "codelist": "SDMX:CL_TIME_FORMAT(1.0)",
-            "label": "Time Format",
-            "description": """This code list provides coded information (based on the ISO 8601 standard) indicating the
- type of time references used in the data. It was released in 2009. More information about this code list and SDMX code 
- lists in general (e.g. list of generic codes for expressing general concepts like "Total", "Unknown", etc.; syntaxes for
- the creation of further codes; general guidelines for the creation of SDMX code lists) can be found at this
- address: https://sdmx.org/?page_id=4345."""
-        },
-        "transportMode": {
-            "codelist": "UNSD:CL_TRANSPORT_MODE(1.0)",
-            "label": "CL_TRANSPORT_MODE",
-            "description": """Description not available"""
-        },
-        "confStatus": {
-            "codelist": "SDMX:CL_CONF_STATUS(1.3)",
-            "label": "Confidentiality Status",
-            "description": """Description not available"""
-        },
-        "expenditureReport": {
-            "codelist": "UIS:CL_TYPE_EXP_REPORTED(1.0)",
-            "label": "Type of expenditure reported",
-            "description": """Description not available"""
-        },
-        "measurePrincip": {
-            "codelist": "OECD:CL_MEASURE_PRINCIP(1.0)",
-            "label": "Measurement principle code list",
-            "description": """Description not available"""
-        },
-        "breakdownGroup": {
-            "codelist": "UIS:CL_BREAKDOWN_GROUP(1.0)",
-            "label": "Breakdown group",
-            "description": """Description not available"""
-        },
-        "compBreakdown": {
-            "codelist": "IAEG-SDGs:CL_COMP_BREAKDOWN(1.18)",
-            "label": "SDG composite breakdown code list",
-            "description": """Description not available"""
-        },
-        "coverageGeo": {
-            "codelist": "ESTAT:CL_COVERAGE_GEO(1.0)",
-            "label": "Geographical coverage",
-            "description": """Defines which type of region is used to compile the index"""
-        },
-        "energyFlows": {
-            "codelist": "ESTAT:CL_ENERGY_FLOWS(1.2)",
-            "label": "Energy flows",
-            "description": """Natural energy inputs (broken down), energy products (broken down), residuals (broken down)"""
-        },
-    # Check
-        "expenditureType": {
-            "codelist": "UIS:CL_EXPENDITURE_TYPE(1.0)",
-            "label": "Expenditure type",
-            "description": """Description not available"""
-        },
-        "fdiRelation": {
-            "codelist": "OECD:CL_FDI_RELATION(1.0)",
-            "label": "FDI relationship code list",
-            "description": """Description not available"""
-        },
-        "tradeSystem": {
-            "codelist": "UNSD:CL_TRADE_SYSTEM(1.0)",
-            "label": "CL_TRADE_SYSTEM",
-            "description": """Description not available"""
-        },
-        "intensity": {
-            "codelist": "UIS:CL_INTENSITY(1.0)",
-            "label": "Intensity",
-            "description": """Description not available"""
-        },
-        "timeTransType": {
-            "codelist": "SDMX:CL_TIMETRANS_TYPE(1.0)",
-            "label": "Time Transformation Type",
-            "description": """Code list for time-related transformation types of time series."""
-        },
-        "coveragePop": {
-            "codelist": "ESTAT:CL_COVERAGE_POP(1.1.0)",
-            "label": "Population coverage",
-            "description": """Description not available"""
-        },
-        "mobility": {
-            "codelist": "UIS:CL_MOBILITY(1.0)",
-            "label": "Mobility",
-            "description": """Description not available"""
-        },
-        "waterFlows": {
-            "codelist": "ESTAT:CL_WATER_FLOWS(1.0)",
-            "label": "Water flows",
-            "description": """Sources of abstracted water, waste water, return flows of water… (+breakdowns)"""
-        },
-        "taxCat": {
-            "codelist": "ESTAT:CL_GFS_TAXCAT(1.2)",
-            "label": "GFS tax category",
-            "description": """Description not available"""
-        },
-        "reportingType": {
-            "codelist": "IAEG-SDGs:CL_REPORTING_TYPE(1.0)",
-            "label": "Reporting type code list",
-            "description": """Reporting type code list"""
-        },
-        "nature": {
-            "codelist": "IAEG-SDGs:CL_NATURE(1.0)",
-            "label": "Nature code list",
-            "description": """Description not available"""
-        },
-        "indType": {
-            "codelist": "ESTAT:CL_IND_TYPE(1.1)",
-            "label": "Indicator type",
-            "description": """Description not available"""
-        },
-        "brideItem": {
-            "codelist": "ESTAT:CL_BRIDGE_ITEM(1.3.0)",
-            "label": "Bridging items",
-            "description": """Items used to bridge for territorial coverage"""
-        },
-        "educationFields": {
-            "codelist": "UIS:CL_EDUCATION_FIELD(1.0)",
-            "label": "Fields of education",
-            "description": """Description not available"""
-        },
-        "material": {
-            "codelist": "ESTAT:CL_MATERIAL(1.1)",
-            "label": "Materials",
-            "description": """Materials classification (products, natural inputs, semi-manufactured products, balancing items)"""
-        },
-        "compMethod": {
-            "codelist": "IMF:CL_COMP_METHOD(1.2)",
-            "label": "Compilation methodology code list",
-            "description": """Description not available"""
-        },
-        "partnerType": {
-            "codelist": "UNSD:CL_PARTNER_TYPE(1.0)",
-            "label": "CL_PARTNER_TYPE",
-            "description": """Description not available"""
-        },
-        "civilStatus": {
-            "codelist": "SDMX:CL_CIVIL_STATUS(1.0)",
-            "label": "Civil (or Marital) Status",
-            "description": """This code list provides a list of values for describing the civil (or marital) status of
- an individual, i.e. the legal, conjugal status of an individual in relation to the marriage laws or customs of the country.
- This code list was formally adopted on 25 November 2013. More information about this code list and SDMX code lists in general
- (e.g. list of generic codes for expressing general concepts like "Total", "Unknown", etc.; syntaxes for the creation of
- further codes; general guidelines for the creation of SDMX code lists) can be found at this
- address: https://sdmx.org/?page_id=4345."""
-        },
-        "naTable": {
-            "codelist": "ESTAT:CL_NA_TABLEID(1.10)",
-            "label": "NA Table IDs",
-            "description": """Description not available"""
-        },
-        "valuation": {
-            "codelist": "ESTAT:CL_VALUATION(1.6)",
-            "label": "Valuation",
-            "description": """Description not available"""
-        },
-        "currency": {
-            "codelist": "IMF:CL_CURRENCY(1.6)",
-            "label": "Currency of issuance or invoicing code list",
-            "description": """Description not available"""
-        },
-        "disability": {
-            "codelist": "IAEG-SDGs:CL_DISABILITY(1.0)",
-            "label": "Disability status code list",
-            "description": """Description not available"""
-        },
-        "naConsolidat": {
-            "codelist": "ESTAT:CL_NA_CONSOLIDAT(1.3)",
-            "label": "Consolidation codes",
-            "description": """Description not available"""
-        },
-        "educationType": {
-            "codelist": "UIS:CL_EDUCATION_TYPE(1.0)",
-            "label": "Education type",
-            "description": """Description not available"""
-        },
-        "commodity": {
-            "codelist": "UNSD:CL_COMMODITY(1.0)",
-            "label": "CL_COMMODITY",
-            "description": """Description not available"""
-        },
-        "adminPriceInd": {
-            "codelist": "ESTAT:CL_AP_DEFINITION(1.0)",
-            "label": "Administered prices indicator",
-            "description": """Description not available"""
-        },
-        "incomeQuantile": {
-            "codelist": "IAEG-SDGs:CL_QUANTILE(1.1)",
-            "label": "Income/wealth quantile code list",
-            "description": """Description not available"""
-        },
-        "stockTrans": {
-            "codelist": "IMF:CL_GFSM_STO(1.0)",
-            "label": "Stocks, Transactions, Other Flows",
-            "description": """Description not available"""
-        },
-        "educationTable": {
-            "codelist": "UIS:CL_EDU_TABLEID(1.0)",
-            "label": "Table identifier",
-            "description": """Description not available"""
-        },
-        "valuesAp": {
-            "codelist": "ESTAT:CL_VALUE_AP(1.0)",
-            "label": "Values for AP DSD",
-            "description": """Description not available"""
-        },
-        "functionalCat": {
-            "codelist": "IMF:CL_FUNCTIONAL_CAT(1.10.1)",
-            "label": "Functional category code list",
-            "description": """Description not available"""
-        },
-        "grade": {
-            "codelist": "UIS:CL_GRADE(1.0)",
-            "label": "Grade",
-            "description": """Description not available"""
-        },
-        "unitMult": {
-            "codelist": "SDMX:CL_UNIT_MULT(1.1)",
-            "label": "Unit Multiplier",
-            "description": """This code list provides code values for indicating the magnitude in the units of measurement.
- More information about this code list and SDMX code lists in general (e.g. list of generic codes for expressing general
- concepts like "Total", "Unknown", etc.; syntaxes for the creation of further codes; general guidelines for the creation
- of SDMX code lists) can be found at this address: https://sdmx.org/?page_id=4345."""
-        },
-        "tradeFlow": {
-            "codelist": "UNSD:CL_TRADE_FLOW(1.0)",
-            "label": "CL_TRADE_FLOW",
-            "description": """Description not available"""
-        },
-        "naPrices": {
-            "codelist": "ESTAT:CL_NA_PRICES(1.1)",
-            "label": "Price codes",
-            "description": """Description not available"""
-        },
-        "airPol": {
-            "codelist": "ESTAT:CL_AIRPOL(1.3.0)",
-            "label": "Air pollutants and greenhouse gasses",
-            "description": """Air pollutants classification"""
-        },
-        "refPeriod": {
-            "codelist": "ESTAT:CL_REF_PERIOD_DTL(1.0)",
-            "label": "Reference period detail codes",
-            "description": """Description not available"""
-        },
-        "typeEntity": {
-            "codelist": "OECD:CL_TYPE_ENTITY(1.1)",
-            "label": "Type of entity code list",
-            "description": """Description not available"""
-        },
-        "originCriterion": {
-            "codelist": "UIS:CL_ORIGIN_CRITERION(1.0)",
-            "label": "Origin criterion",
-            "description": """Description not available"""
-        },
-        #"0"
-        "timeTransPer": {
-            "codelist": "SDMX:CL_TIMETRANS_PER(1.0)",
-            "label": "Time Transformation Period",
-            "description": """Code list for information about the number of periods used for a time-related
- transformation of the time series."""
-        },
-        "customsProc": {
-            "codelist": "UNSD:CL_CUSTOMS_PROC(1.0)",
-            "label": "CL_CUSTOMS_PROC",
-            "description": """Description not available"""
-        },
-        "measure": {
-            "codelist": "UNSD:CL_MEASURE(1.0)",
-            "label": "CL_MEASURE",
-            "description": """Description not available"""
-        },
-        "regionals": {
-            "codelist": "ESTAT:CL_REGIONAL(6.1.0)",
-            "label": "Regional codes",
-            "description": """Description not available"""
-        },
-        "itemPrice": {
-            "codelist": "ESTAT:CL_ITEM_PRICE(2.0)",
-            "label": "Item in the classification",
-            "description": """Description not available"""
-        },
-        "breakReason": {
-            "codelist": "SDMX:CL_BREAK_REASON(1.0)",
-            "label": "Reason for the break in time series",
-            "description": """Description not available"""
-        },
-        "sector": {
-            "codelist": "UIS:CL_SECTOR(1.0)",
-            "label": "Reference/Counterpart institutional sector",
-            "description": """Description not available"""
-        },
-        "demandProd": {
-            "codelist": "ESTAT:CL_DEMAND_PROD(1.0)",
-            "label": "Demand or production",
-            "description": """Description not available"""
-        },
-        "geoInfoType": {
-            "codelist": "IAEG-SDGs:CL_GEO_INFO_TYPE(1.0)",
-            "label": "Geoinformation type code list",
-            "description": """Description not available"""
-        },
-        "series": {
-            "codelist": "IAEG-SDGs:CL_SERIES(1.18)",
-            "label": "SDG Series Code List",
-            "description": """SDG Series Code List"""
-        },
-        "interactUnits": {
-            "codelist": "ESTAT:CL_INTERACTORS(1.3)",
-            "label": "Units interacting with the environment",
-            "description": """(emitting green house gases and air pollutants, suppliers / consumers of energy, water,
- natural resources) Covers ISIC/NACE, households and Total"""
-        },
-        "economicFunc": {
-            "codelist": "ESTAT:CL_GFS_ECOFUNC(1.0)",
-            "label": "GFS economic function",
-            "description": """Description not available"""
-        },
-        "maturity": {
-            "codelist": "ESTAT:CL_MATURITY(1.8)",
-            "label": "Original and Residual Maturity",
-            "description": """Description not available"""
-        },
-        "indexType": {
-            "codelist": "ESTAT:CL_IDX_TYPE(1.0)",
-            "label": "Index type",
-            "description": """Differentiates between different types of indices"""
-        },
-        "workBalance": {
-            "codelist": "ESTAT:CL_EDP_WBB(1.0)",
-            "label": "EDP working balance basis",
-            "description": """Description not available"""
-        },
-    }
+#     - description (str): description of the concept, or DESCRIPTION_NA
+SINGLES_FILE = Path(__file__).with_name("singles.json")
+
+
+class CodelistEntry(NamedTuple):
+    """
+    A SINGLES entry: codelist ID, human-readable label and description of a concept.
+
+    SINGLES values used to be dicts, so the fields can also be read by key
+    (``entry["codelist"]``), as well as by attribute or position.
+    """
+    codelist: str
+    label: str
+    description: str
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+
+@lru_cache(maxsize=1)
+def _singles_raw():
+    """Loads SINGLES records once as tuples (key, codelist, label, description)."""
+    with open(SINGLES_FILE, "r", encoding="utf-8") as f:
+        records = json.load(f)
+    # Codelist IDs share agency prefixes, so they are interned;
+    # missing descriptions share the DESCRIPTION_NA object
+    return tuple(
+        (
+            r["key"],
+            sys.intern(r["codelist"]),
+            r["label"],
+            DESCRIPTION_NA if r["description"] == DESCRIPTION_NA else r["description"],
+        )
+        for r in records
+    )
+
+
+@lru_cache(maxsize=1)
+def _singles():
+    """Builds the frozen SINGLES mapping: key -> CodelistEntry."""
+    return MappingProxyType({
+        k: CodelistEntry(cl, label, desc) for k, cl, label, desc in _singles_raw()
+    })
+
+
+@lru_cache(maxsize=1)
+def _singles_codelist():
+    """Flat (structure-of-arrays) view: concept short name -> codelist ID."""
+    return {k: cl for k, cl, _, _ in _singles_raw()}
+
+
+@lru_cache(maxsize=1)
+def _singles_by_codelist():
+    """Reverse index codelist ID -> concept short name (the last entry wins
+    when several concepts share a codelist, as with a linear scan)."""
+    return {v: k for k, v in _singles_codelist().items()}
+
+
+# Module attributes materialized on first access (PEP 562)
+_LAZY_VIEWS = {
+    "SINGLES": _singles,
+    "SINGLES_CODELIST": _singles_codelist,
+    "SINGLES_BY_CODELIST": _singles_by_codelist,
+}
+
+
+def __getattr__(name):
+    builder = _LAZY_VIEWS.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = builder()
+    return value
+
+
+def concept_for(codelist_id):
+    """
+    Returns the SINGLES concept short name for a codelist.
+
+    Parameters
+    ----------
+    codelist_id : str
+        Codelist identifier, e.g. "SDMX:CL_FREQ(2.1)".
+
+    Returns
+    -------
+    str or None
+        Concept short name (e.g. "freq"), or None if the codelist is not in SINGLES.
+
+    Examples
+    --------
+    >>> concept_for("SDMX:CL_FREQ(2.1)")
+    'freq'
+    """
+    return _singles_by_codelist().get(codelist_id)
+
 
 # Prefixes for output in the Turtle RDF model file
 PREFIXES = f"""
@@ -4,10 +4,27 @@
 
 import re
 from collections import defaultdict
+from functools import lru_cache
 
 from src.sdmxclgen.analyze_templates import GROUP_CODELISTS
 from src.sdmxclgen.templates import AGENCY
 
+# Position of each agency in AGENCY (first occurrence, as list.index)
+AGENCY_INDEX = {agency: i for i, agency in reversed(list(enumerate(AGENCY)))}
+
+# Linear-time (non-backtracking) RE2 engine if the optional google-re2 package is installed.
+# RE2's \d is ASCII-only while re's matches any Unicode digit, so RE2 only gets ASCII identifiers
+try:
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
+# Codelist identifier: <prefix>:S?CL_<NAME>(<version>)
+_NAME_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ_"
+_CL_PATTERN = r"(.*?):S?CL_([A-Z_]+?)(?:\d+)?\(([^)]+)\)"
+_CL_RE = re.compile(_CL_PATTERN)
+_CL_RE_ASCII = _re_engine.compile(_CL_PATTERN)
+
 
 def get_multiple_codelists_per_agency():
     """
@@ -38,7 +55,8 @@ def get_multiple_codelists_per_agency():
     -----
     1. Uses the global GROUP_CODELISTS dictionary, which contains information
        about groups and their codelists.
-    2. For each codelist, `get_prefix_name_version(cl)` is called to determine the agency.
+    2. The agency of each codelist is determined with `get_prefix_name_version(cl)`; the results
+       for all GROUP_CODELISTS identifiers are computed once and reused (see `_group_codelist_agencies`).
     3. If an agency has more than one codelist in a group, that agency-codelists pair
        is included in the result.
 
@@ -48,14 +66,14 @@ def get_multiple_codelists_per_agency():
     >>> for group_id, agencies in result.items():
     ...     print(group_id, agencies)
     """
+    agency_of = _group_codelist_agencies()
     group_multiple_codelists = {}
     for group_id, group_data in GROUP_CODELISTS.items():
         codelists = group_data["codelists"]
         agency_dict = defaultdict(list)
 
         for cl in codelists:
-            agency, _, cl_id, _, _ = get_prefix_name_version(cl)
-            agency_dict[agency].append(cl)
+            agency_dict[agency_of[cl]].append(cl)
 
         # Filter agencies with more than one codelist in the group
         multiple_codelists = {agency: cls for agency, cls in agency_dict.items() if len(cls) > 1}
@@ -64,6 +82,18 @@ def get_multiple_codelists_per_agency():
     return group_multiple_codelists
 
 
+@lru_cache(maxsize=None)
+def _group_codelist_agencies():
+    """Returns {codelist: agency} for every codelist in GROUP_CODELISTS, parsed once on first use."""
+    agencies = {}
+    for group_data in GROUP_CODELISTS.values():
+        for cl in group_data["codelists"]:
+            if cl not in agencies:
+                agency, _, _, _, _ = get_prefix_name_version(cl)
+                agencies[cl] = agency
+    return agencies
+
+
 def get_prefix_name_version(input_string):
     """
     Extracts the prefix (agency), name, and version from a codelist identifier string.
@@ -95,6 +125,8 @@ def get_prefix_name_version(input_string):
     1. Regex looks for strings in the format: <prefix>:S?CL_<NAME>(<version>).
     2. If the format does not match expectations, an error message is printed and
        ((None, None, None), (len(AGENCY), (0,))) is returned.
+    3. Parsing results are memoized (identifiers repeat, e.g. in sort keys); the error
+       message is still printed on every call with an unexpected string.
 
     Examples
     --------
@@ -104,19 +136,59 @@ def get_prefix_name_version(input_string):
     >>> get_prefix_name_version("ESTAT:CL_EMPLOYMENT_DATA(2.0)")
     ('ESTAT', 0, 'EMPLOYMENT_DATA', '2.0', (2, 0))
     """
-    match = re.match(r"(.*?):S?CL_([A-Z_]+?)(?:\d+)?\(([^)]+)\)", input_string)
-    if match:
-        prefix = match.group(1)
-        name = match.group(2)
-        version = match.group(3)
+    parsed = _parse_codelist_id(input_string)
+    if parsed is None:
+        print(f"Error: Input string '{input_string}' does not match expected format.")
+        return (None, None, None), (len(AGENCY), (0,))
+    return parsed
 
-        prefix_index = AGENCY.index(prefix) if prefix in AGENCY else len(AGENCY)
-        version_tuple = tuple(map(int, version.split('.'))) if version else (0,)
 
-        return prefix, prefix_index, name, version, version_tuple
+def _split_codelist_id(input_string):
+    """
+    Splits "<prefix>:S?CL_<NAME>[digits](<version>)" with str.partition, without the regex engine.
+
+    Returns (prefix, name, version) exactly as the groups of `_CL_RE` would be,
+    or None when the string is not in this common form (the caller then falls back to `_CL_RE`).
+    """
+    prefix, sep, rest = input_string.partition(":")
+    if not sep or "\n" in prefix:
+        return None
+    name_part, sep, tail = rest.partition("(")
+    version, sep2, _ = tail.partition(")")
+    if not sep or not sep2 or not version:
+        return None
+
+    if name_part.startswith("SCL_"):
+        name_part = name_part[4:]
+    elif name_part.startswith("CL_"):
+        name_part = name_part[3:]
     else:
-        print(f"Error: Input string '{input_string}' does not match expected format.")
-        return (None, None, None), (len(AGENCY), (0,))
+        return None
+
+    # <NAME> is [A-Z_]+, optionally followed by a (dropped) ASCII number
+    name = name_part.rstrip("0123456789")
+    if not name or name.strip(_NAME_CHARS):
+        return None
+    return prefix, name, version
+
+
+@lru_cache(maxsize=None)
+def _parse_codelist_id(input_string):
+    """Memoized part of `get_prefix_name_version`: the parsed tuple, or None if the string does not match."""
+    parts = _split_codelist_id(input_string)
+    if parts is None:
+        # Edge cases (e.g. ':' inside the prefix) are left to the regex
+        match = (_CL_RE_ASCII if input_string.isascii() else _CL_RE).match(input_string)
+        if match is None:
+            return None
+        parts = match.groups()
+
+    prefix, name, version = parts
+
+    prefix_index = AGENCY_INDEX.get(prefix, len(AGENCY))
+    version_tuple = tuple(map(int, version.split('.'))) if version else (0,)
+
+    return prefix, prefix_index, name, version, version_tuple
 
 
 def get_pref_ver_key(codelist_id):
@@ -2,11 +2,62 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright (c) 2025 Semantic R&D Group
 
+import json
+import logging
+import os
+import pickle
+import re
+from collections import defaultdict
+from functools import lru_cache
+from itertools import islice
 import pandas as pd
-from rdflib import Graph, URIRef, Namespace, RDF, Literal
-from .templates import SDMX_SCHEME_CONCEPT_CL_ASS, SDMX_CONCEPT_SCHEMES, SDMX_CODES, SDMX_CODE_URI
+from rdflib import Graph, Namespace, RDF, Literal
+from .templates import SDMX_SCHEME_CONCEPT_CL_ASS, SDMX_CONCEPT_SCHEMES, SDMX_CODES, SDMX_CODE_URI, DESCRIPTION_NA
 from .gen_template import NEW_PREF, NEW_PREF_CODE
 
+logger = logging.getLogger(__name__)
+
+# Optional Rust-based RDF parser (pyoxigraph >= 0.4); without it rdflib is used
+try:
+    import pyoxigraph
+except ImportError:
+    pyoxigraph = None
+
+# SKOS namespace and terms, created once at import
+SKOS_NS = Namespace("http://www.w3.org/2004/02/skos/core#")
+SKOS_CONCEPT_SCHEME = SKOS_NS.ConceptScheme
+SKOS_NOTATION = SKOS_NS.notation
+SKOS_IN_SCHEME = SKOS_NS.inScheme
+
+# English prepositions skipped when forming scheme identifiers (see get_scheme_id)
+PREPOSITIONS = frozenset({
+    "of", "in", "on", "at", "for", "with", "about", "against", "between", "into", "through", "during",
+    "before", "after", "above", "below", "under", "over", "to", "from", "by", "as", "like", "since",
+    "until", "within", "without", "among", "along", "behind", "beyond", "but", "except", "up", "down",
+    "off", "onto", "out", "upon"
+})
+
+# Columns required by get_scheme_dict and get_code_description_dict
+_SCHEME_REQUIRED = frozenset({"CodelistID", "CL Name", "SchemeID", "Codelist Description", "URL"})
+_CODE_DESC_REQUIRED = frozenset({"CodelistID", "Agency", "Code", "Code Description"})
+
+
+# Printable ASCII without '"' and '\': such strings need no escaping in a Turtle literal
+_N3_SAFE_RE = re.compile(r'[ !#-\[\]-~]*')
+
+
+def _lit_n3(value: str) -> str:
+    """Returns the Turtle (n3) form of a plain literal; strings that need no escaping are quoted directly."""
+    if isinstance(value, str) and _N3_SAFE_RE.fullmatch(value):
+        return f'"{value}"'
+    return _lit_n3_escaped(value)
+
+
+@lru_cache(maxsize=65536)
+def _lit_n3_escaped(value) -> str:
+    """RDFLib n3 form of a literal, cached since the same labels recur across codelists."""
+    return Literal(value).n3()
+
 # Consider
 # ESTAT:CL_INSTR_ASSET93(1.5) - ESTAT,1,INSTR_ASSET,1.5,(1,5)
 # ESTAT:CL_SECTOR93(1.4) - ESTAT,1,SECTOR,1.4,(1,4)
@@ -57,8 +108,8 @@ def get_concepts_by_scheme_id(key: str, glossary=SDMX_SCHEME_CONCEPT_CL_ASS) ->
         # print(f"Key '{key}' not found in glossary.")
         return []
 
-def get_singles_template(df: pd.DataFrame, template_file="analysis/gen_template.py") -> None:
-    """Generates and saves the Python dictionary SINGLES from codelists of type 'SINGLE'.
+def get_singles_template(df: pd.DataFrame, template_file="analysis/singles.json") -> None:
+    """Generates and saves the SINGLES records from codelists of type 'SINGLE'.
 
     Parameters
     ----------
@@ -70,60 +121,63 @@ def get_singles_template(df: pd.DataFrame, template_file="analysis/gen_template.
         - 'Codelist Description' : str — description of the codelist.
 
     template_file : str, optional
-        Path to the file where the `SINGLES` dictionary will be saved.
-        Default: "analysis/gen_template.py".
+        Path to the JSON file where the `SINGLES` records will be saved.
+        Default: "analysis/singles.json".
 
     Returns
     -------
     None
-        The result is saved as a Python file. Returns nothing.
+        The result is saved as a JSON file. Returns nothing.
 
     Notes
     -----
-    - For each row with `GroupType = 'SINGLE'`, a record is created in the SINGLES dictionary.
+    - For each row with `GroupType = 'SINGLE'`, a record {key, codelist, label, description} is created.
     - If a SchemeID has already been encountered, an index is added to avoid duplicate keys.
-    - The output file contains a ready-to-use dictionary that can be imported into other modules.
+    - The output file has the format of `gen_template.SINGLES_FILE` (src/sdmxclgen/singles.json),
+      which it can replace once reviewed.
 
     Examples
     --------
     >>> df = pd.read_csv("all_cl_data.csv")
-    >>> get_singles_template(df, "output_template.py")
-    # -> Creates a Python file with the SINGLES dictionary based on SINGLE codelists.
+    >>> get_singles_template(df, "singles.json")
+    # -> Creates a JSON file with the SINGLES records based on SINGLE codelists.
     """
 
-    # Filter rows with groupType = SINGLE
-    filtered_df = df[df['GroupType'] == 'SINGLE']
+    # Filter rows with groupType = SINGLE (only the columns used below)
+    filtered_df = df.loc[df['GroupType'] == 'SINGLE', ['CL Name', 'CodelistID', 'Codelist Description']]
+    labels = filtered_df['CL Name'].tolist()
 
-    # Build the SINGLES dictionary
-    singles = {}
+    # Build the SINGLES records
+    singles = []
     seen_scheme_ids = set()
 
     index = 0
-    for _, row in filtered_df.iterrows():
-        scheme_id = get_scheme_id(row['CL Name'])
+    for scheme_id, label, codelist_id, description in zip(
+        get_scheme_ids(labels),
+        labels,
+        filtered_df['CodelistID'].tolist(),
+        filtered_df['Codelist Description'].tolist()
+    ):
         if scheme_id in seen_scheme_ids:
-            print(f"Duplicate SchemeID found: {scheme_id}")
+            logger.warning("Duplicate SchemeID found: %s", scheme_id)
             scheme_id = str(index) + scheme_id
             index += 1
         seen_scheme_ids.add(scheme_id)
 
-        singles[scheme_id] = {
-            "codelist": row['CodelistID'],
-            "label": row['CL Name'],
-            "description": row['Codelist Description']
-        }
+        # Values are written as strings (missing cells become "nan", as before)
+        singles.append({
+            "key": scheme_id,
+            "codelist": str(codelist_id),
+            "label": str(label),
+            "description": str(description)
+        })
 
-    # Write dictionary to Python file with formatted output
-    with open(template_file, "w") as f:
-        f.write("SINGLES = {\n    ")
-        for key, value in singles.items():
-            f.write(f"    '{key}': {{\n    ")
-            f.write(f"        'codelist': '{value['codelist']}',\n    ")
-            f.write(f"        'label': '{value['label']}',\n    ")
-            f.write(f"        'description': \"\"\"{value['description']}\"\"\"\n    ")
-            f.write("    },\n    ")
-        f.write("}")
+    # Write the records as a JSON list (the format read by gen_template)
+    with open(template_file, "w", encoding="utf-8") as f:
+        json.dump(singles, f, indent=4, ensure_ascii=False)
+        f.write("\n")
 
+@lru_cache(maxsize=4096)
 def get_scheme_id(cl_label: str) -> str:
     """Generates a scheme identifier from the codelist label, excluding prepositions.
 
@@ -157,14 +211,8 @@ def get_scheme_id(cl_label: str) -> str:
     ''
     """
 
-    # List of English prepositions
-    prepositions = {"of", "in", "on", "at", "for", "with", "about", "against", "between", "into", "through", "during",
-                    "before", "after", "above", "below", "under", "over", "to", "from", "by", "as", "like", "since",
-                    "until", "within", "without", "among", "along", "behind", "beyond", "but", "except", "up", "down",
-                    "off", "onto", "out", "upon"}
-
-    # Remove prepositions and split into words
-    words = [word for word in cl_label.split() if word.lower() not in prepositions]
+    # Remove prepositions and split into words (only the first two are needed)
+    words = list(islice((word for word in cl_label.split() if word.lower() not in PREPOSITIONS), 2))
 
     # Keep only first two words
     if len(words) == 0:
@@ -175,7 +223,37 @@ def get_scheme_id(cl_label: str) -> str:
         first, second = words[0], words[1]
         return first.lower() + second.capitalize()
 
-def get_sdmx_schemes_codes(file_path: str) -> tuple[set, dict]:
+
+def get_scheme_ids(cl_labels) -> list:
+    """Generates scheme identifiers for a sequence of codelist labels (see `get_scheme_id`).
+
+    Parameters
+    ----------
+    cl_labels : iterable of str
+        Codelist labels, e.g. a list or the values of a pandas Series.
+
+    Returns
+    -------
+    list of str
+        Scheme identifiers in the order of the labels.
+
+    Examples
+    --------
+    >>> get_scheme_ids(["Frequency of Reporting", "Unit multiplier"])
+    ['frequencyReporting', 'unitMultiplier']
+    """
+    return [get_scheme_id(cl_label) for cl_label in cl_labels]
+
+
+def _local_name(uri: str) -> str:
+    """Returns the part of a URI after the last '#' or, without '#', after the last '/'."""
+    _, sep, tail = uri.rpartition('#')
+    if not sep:
+        _, _, tail = uri.rpartition('/')
+    return tail
+
+
+def get_sdmx_schemes_codes(file_path: str, use_cache: bool = True) -> tuple[set, dict]:
     """Extracts concept scheme identifiers and existing codes from an RDF graph in Turtle format.
 
     Parameters
@@ -183,6 +261,10 @@ def get_sdmx_schemes_codes(file_path: str) -> tuple[set, dict]:
     file_path : str
         Path to the Turtle (TTL) file containing codelist and concept definitions.
 
+    use_cache : bool, optional
+        Reuse the result pickled next to the file (``<file_path>.cache.pkl``) while it is
+        not older than the TTL file. Default: True.
+
     Returns
     -------
     tuple
@@ -192,7 +274,10 @@ def get_sdmx_schemes_codes(file_path: str) -> tuple[set, dict]:
 
     Notes
     -----
-    - Uses RDFLib to load and traverse the graph.
+    - Uses pyoxigraph (if installed) to stream the Turtle triples, otherwise RDFLib
+      to load and traverse the graph; both give the same result.
+    - The parsed result is cached on disk, keyed by the modification time of the TTL file;
+      the cache is written to a temporary file and renamed, an unreadable one is rebuilt.
     - Assumes concepts and schemes are represented using the SKOS ontology.
     - `ConceptScheme` is defined via type `skos:ConceptScheme`.
     - Codes are extracted from triples of the form:
@@ -207,26 +292,80 @@ def get_sdmx_schemes_codes(file_path: str) -> tuple[set, dict]:
     >>> print(codes['http://example.org/codelist#FREQ'])
     {'A', 'M', 'Q', 'Y'}
     """
+    if not use_cache:
+        return _parse_sdmx_schemes_codes(file_path)
+
+    cache_path = f"{file_path}.cache.pkl"
+    try:
+        if os.stat(cache_path).st_mtime_ns >= os.stat(file_path).st_mtime_ns:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    result = _parse_sdmx_schemes_codes(file_path)
+    try:
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(result, f, protocol=5)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning("Schemes and codes of %s not cached: %s", file_path, e)
+    return result
+
+def _parse_sdmx_schemes_codes(file_path: str) -> tuple[set, dict]:
+    """Parses the TTL file for `get_sdmx_schemes_codes` (pyoxigraph if installed, otherwise RDFLib)."""
+    if pyoxigraph is not None:
+        return _sdmx_schemes_codes_oxigraph(file_path)
+
     # Load the TTL file
     g = Graph()
     g.parse(file_path, format='turtle')
 
-    # Define the SKOS namespace
-    SKOS = Namespace("http://www.w3.org/2004/02/skos/core#")
-
     concept_schemes_names = set()
-    for s, p, o in g.triples((None, RDF.type, SKOS.ConceptScheme)):
-        uri = str(s)
-        name = uri.split('#')[-1] if '#' in uri else uri.split('/')[-1]
-        concept_schemes_names.add(name)
+    for s, p, o in g.triples((None, RDF.type, SKOS_CONCEPT_SCHEME)):
+        concept_schemes_names.add(_local_name(str(s)))
+
+    # Scheme of each concept, from one pass over skos:inScheme (first scheme per concept)
+    scheme_of = {}
+    for s, scheme in g.subject_objects(SKOS_IN_SCHEME):
+        scheme_of.setdefault(s, scheme)
 
     # Extract all codes
-    existing_codes = {}
-    for s, p, o in g.triples((None, URIRef("http://www.w3.org/2004/02/skos/core#notation"), None)):
-        scheme = next(g.objects(s, URIRef("http://www.w3.org/2004/02/skos/core#inScheme")), None)
+    existing_codes = defaultdict(set)
+    for s, o in g.subject_objects(SKOS_NOTATION):
+        scheme = scheme_of.get(s)
+        if scheme:
+            existing_codes[str(scheme)].add(str(o))
+    return concept_schemes_names, dict(existing_codes)
+
+def _sdmx_schemes_codes_oxigraph(file_path: str) -> tuple[set, dict]:
+    """pyoxigraph variant of `get_sdmx_schemes_codes`: a single pass over the parsed triples."""
+    rdf_type = str(RDF.type)
+    concept_scheme = str(SKOS_CONCEPT_SCHEME)
+    notation = str(SKOS_NOTATION)
+    in_scheme = str(SKOS_IN_SCHEME)
+
+    concept_schemes_names = set()
+    scheme_of = {}
+    notations = []
+    for triple in pyoxigraph.parse(path=file_path, format=pyoxigraph.RdfFormat.TURTLE):
+        predicate = triple.predicate.value
+        if predicate == rdf_type:
+            if triple.object.value == concept_scheme:
+                concept_schemes_names.add(_local_name(triple.subject.value))
+        elif predicate == in_scheme:
+            scheme_of.setdefault(triple.subject, triple.object.value)
+        elif predicate == notation:
+            notations.append((triple.subject, triple.object.value))
+
+    existing_codes = defaultdict(set)
+    for subject, code in notations:
+        scheme = scheme_of.get(subject)
         if scheme:
-            existing_codes.setdefault(str(scheme), set()).add(str(o))
-    return concept_schemes_names, existing_codes
+            existing_codes[scheme].add(code)
+    return concept_schemes_names, dict(existing_codes)
+
 
 def get_scheme_dict(df: pd.DataFrame, scheme_id: str) -> dict:
     """Builds a dictionary with descriptions of codelists related to a given scheme.
@@ -241,6 +380,9 @@ def get_scheme_dict(df: pd.DataFrame, scheme_id: str) -> dict:
         - 'Codelist Description' : str — codelist description.
         - 'URL' : str — source link for the codelist.
 
+        May be indexed by 'SchemeID' (``df.set_index("SchemeID", drop=False)``)
+        to look the scheme up through the index instead of a full column scan.
+
     scheme_id : str
         The scheme identifier used to select rows in the table.
 
@@ -283,12 +425,17 @@ def get_scheme_dict(df: pd.DataFrame, scheme_id: str) -> dict:
     """
 
     # Check for required columns
-    required_columns = {"CodelistID", "CL Name", "SchemeID", "Codelist Description", "URL"}
-    if not required_columns.issubset(df.columns):
-        raise ValueError(f"DataFrame must contain the following columns: {required_columns}")
-
-    # Filter DataFrame by SchemeID
-    filtered_df = df[df["SchemeID"] == scheme_id]
+    if not _SCHEME_REQUIRED.issubset(df.columns):
+        raise ValueError(f"DataFrame must contain the following columns: {set(_SCHEME_REQUIRED)}")
+
+    # Filter DataFrame by SchemeID (an index lookup if the table is indexed by SchemeID)
+    if df.index.name == "SchemeID":
+        try:
+            filtered_df = df.loc[[scheme_id]]
+        except KeyError:
+            return {}
+    else:
+        filtered_df = df[df["SchemeID"] == scheme_id]
 
     if filtered_df.empty:
         return {}  # If no data for the scheme, return empty dictionary
@@ -297,12 +444,14 @@ def get_scheme_dict(df: pd.DataFrame, scheme_id: str) -> dict:
     description_dict = {
         scheme_id: [
             {
-                "codelistID": row['CodelistID'],
-                "label": row['CL Name'],
-                "codelistDescription": row['Codelist Description'],
-                "URL": row['URL']
+                "codelistID": codelist_id,
+                "label": label,
+                "codelistDescription": codelist_description,
+                "URL": url
             }
-            for _, row in filtered_df.iterrows()
+            for codelist_id, label, codelist_description, url in zip(
+                filtered_df['CodelistID'], filtered_df['CL Name'], filtered_df['Codelist Description'], filtered_df['URL']
+            )
         ]
     }
 
@@ -360,14 +509,22 @@ def get_from_scheme_dict(scheme_dict: dict, scheme_id: str) -> tuple:
 
     # Check if scheme_id exists in dictionary
     if scheme_id not in scheme_dict:
-        print(f"Scheme ID '{scheme_id}' not found in scheme dictionary.")
+        logger.warning("Scheme ID '%s' not found in scheme dictionary.", scheme_id)
         return ()
 
-    # Extract labels and build sets/lists
-    labels =  {item.get("label") for item in scheme_dict[scheme_id] if "label" in item}
-    descriptions = {f"{item['codelistID']}: {item['codelistDescription']}" for item in scheme_dict[scheme_id]}
-    source_codelists = [item.get("codelistID") for item in scheme_dict[scheme_id] if "codelistID" in item]
-    source_urls = [item.get("URL") for item in scheme_dict[scheme_id] if "URL" in item]
+    # Extract labels and build sets/lists in one pass (items come from get_scheme_dict, so "label" is always set)
+    labels = set()
+    descriptions = set()
+    source_codelists = []
+    source_urls = []
+    for item in scheme_dict[scheme_id]:
+        labels.add(item["label"])
+        codelist_id = item.get("codelistID")
+        if codelist_id is not None:
+            source_codelists.append(codelist_id)
+            descriptions.add(f"{codelist_id}: {item['codelistDescription']}")
+        if "URL" in item:
+            source_urls.append(item["URL"])
 
     return labels, descriptions, source_codelists, source_urls
 #   labels, descriptions, source_codelists, source_urls = get_from_scheme_dict(scheme_dict, scheme_id)
@@ -439,10 +596,10 @@ def get_concept_scheme_str(concept_scheme_name: str, in_scheme_dict: dict, sdmx_
     # Optional validation
     for label in labels:
         if label == "Label no accessible":
-            print(f"ERROR (get_concept_scheme_str): For {concept_scheme_name} {label}")
+            logger.error("(get_concept_scheme_str): For %s %s", concept_scheme_name, label)
     for description in descriptions:
         if description == "Description no accessible":
-            print(f"ERROR (get_concept_scheme_str): For {concept_scheme_name} {description}")
+            logger.error("(get_concept_scheme_str): For %s %s", concept_scheme_name, description)
 
     concept_scheme_title = f"""
 #####################################################
@@ -454,84 +611,84 @@ def get_concept_scheme_str(concept_scheme_name: str, in_scheme_dict: dict, sdmx_
     concept_scheme_beg = f"""{concept_scheme_id} a skos:ConceptScheme ;
     rdfs:subClassOf sdmx-code:ConceptScheme ;\n"""
 
+    parts = [concept_scheme_title, concept_scheme_beg]
+
     index = 0
-    label_concept  = concept_scheme_labels = ""
+    label_concept = ""
     for label in labels:
         index += 1
 #        label_concept = label
-        label_n3 = Literal(label + " - codelist scheme").n3()
+        label_n3 = _lit_n3(label + " - codelist scheme")
         if index == 1:
             label_concept = label
-            concept_scheme_labels = f"""    skos:prefLabel {label_n3}@en ;
-    rdfs:label {label_n3}@en ;\n"""
+            parts.append(f"""    skos:prefLabel {label_n3}@en ;
+    rdfs:label {label_n3}@en ;\n""")
         else:
-            concept_scheme_labels = concept_scheme_labels + f"    skos:altLabel {label_n3}@en ;\n"
+            parts.append(f"    skos:altLabel {label_n3}@en ;\n")
 
-    concept_scheme_notation = f"""    skos:notation "CL_{concept_scheme_name.upper()}" ;\n"""
+    parts.append(f"""    skos:notation "CL_{concept_scheme_name.upper()}" ;\n""")
 
-    concept_scheme_beg = concept_scheme_beg + concept_scheme_labels + concept_scheme_notation
-    concept_scheme_str = concept_scheme_title + concept_scheme_beg
-
-    index = 0
-    concept_scheme_notes = concept_scheme_class_end_comm = ""
-    description_concept_n3 = ""
+    note_parts = []
+    concept_scheme_class_end_comm = ""
+    # Descriptions are "AGENCY:ID(version): text"; the text segment is compared (at most 3 splits)
+    description_na = f" {DESCRIPTION_NA}"
     for description in descriptions:
-        description_n3 = Literal(description).n3()
-        index += 1
-        if index == 1:
-            if description.split(':')[2] != " Description not available":
-                description_concept_n3 = description_n3
-                concept_scheme_notes = f"    skos:note {description_n3}@en ;\n"
-        else:
-            if description.split(':')[2] != " Description not available":
-                concept_scheme_notes = concept_scheme_notes +  f"    skos:note {description_n3}@en ;\n"
+        if description.split(':', 3)[2] != description_na:
+            note_parts.append(f"    skos:note {_lit_n3(description)}@en ;\n")
 
     if len(source_codelists) > 1:
         cls = ", ".join(source_codelists)
         concept_scheme_def = f"""\"A reference {concept_scheme_name} codelist combining {cls}\"@en ;\n"""
-        concept_scheme_comb = "    skos:definition " + concept_scheme_def
+        parts.append("    skos:definition " + concept_scheme_def)
     elif len(source_codelists) == 1:
         cls = source_codelists[0]
         concept_scheme_def = f"""\"A reference {concept_scheme_name} codelist based on {cls}\"@en ;\n"""
-        concept_scheme_comb = "    skos:definition " + concept_scheme_def
+        parts.append("    skos:definition " + concept_scheme_def)
     else:
-        concept_scheme_def = concept_scheme_comb = ""
+        concept_scheme_def = ""
 
-    for url in source_urls:
-        concept_scheme_comb = concept_scheme_comb + f"""    rdfs:seeAlso <{url}> ;\n"""
+    parts.extend([f"""    rdfs:seeAlso <{url}> ;\n""" for url in source_urls])
+    parts.extend(note_parts)
 
-    concept_scheme_concept = ""
     concepts = get_concepts_by_scheme_id(concept_scheme_name)
     if len(concepts) > 0:
         concept_str = f"{NEW_PREF}-concept:" + f", {NEW_PREF}-concept:".join(concepts)
-        concept_scheme_concept = f"    rdfs:seeAlso " + concept_str + " ;\n"
-        concept_scheme_concept = concept_scheme_concept + f"    skos:related " + concept_str + " ;\n"
-
-    concept_scheme_end = f"""    rdfs:seeAlso {NEW_PREF_CODE}:{concept_class_name} .\n\n"""
+        parts.append(f"    rdfs:seeAlso " + concept_str + " ;\n")
+        parts.append(f"    skos:related " + concept_str + " ;\n")
 
-    concept_scheme_str = concept_scheme_str + concept_scheme_comb + concept_scheme_notes + concept_scheme_concept + concept_scheme_end
+    parts.append(f"""    rdfs:seeAlso {NEW_PREF_CODE}:{concept_class_name} .\n\n""")
 
     if exact:
-        concept_scheme_str = concept_scheme_str + f"{concept_scheme_id} skos:exactMatch {sdmx_scheme_uri} .\n\n"
+        parts.append(f"{concept_scheme_id} skos:exactMatch {sdmx_scheme_uri} .\n\n")
 
     # Class definition
     #------------------------
-    label_n3 = Literal(label_concept + " - codelist class").n3()
+    label_n3 = _lit_n3(label_concept + " - codelist class")
 
-    concept_scheme_class_str = f"""{concept_class_id} a rdfs:Class ;
+    parts.append(f"""{concept_class_id} a rdfs:Class ;
     rdfs:subClassOf skos:Concept ;
     skos:prefLabel {label_n3}@en ;
-    rdfs:label {label_n3}@en ;\n"""
+    rdfs:label {label_n3}@en ;\n""")
 
     if len(concept_scheme_class_end_comm)>0:
-        concept_scheme_class_str = concept_scheme_class_str + f"    rdfs:comment {concept_scheme_class_end_comm}"
+        parts.append(f"    rdfs:comment {concept_scheme_class_end_comm}")
 
-    concept_scheme_class_end = f"""    rdfs:isDefinedBy {concept_scheme_id} ;
-    skos:inScheme {concept_scheme_id} .\n\n"""
+    parts.append(f"""    rdfs:isDefinedBy {concept_scheme_id} ;
+    skos:inScheme {concept_scheme_id} .\n\n""")
 
-    concept_scheme_class_str = concept_scheme_class_str + concept_scheme_class_end
+    return "".join(parts), _lit_n3(label_concept), concept_scheme_def #description_concept_n3
 
-    return concept_scheme_str + concept_scheme_class_str, Literal(label_concept).n3(), concept_scheme_def #description_concept_n3
+@lru_cache(maxsize=1024)
+def _concept_prefixes(concept_scheme_name: str) -> tuple:
+    """Returns the per-scheme parts of a concept block: the scheme ID and the type/scheme lines after the concept ID."""
+    scheme_id = f"{NEW_PREF_CODE}:{concept_scheme_name}"
+    concept_class_name = concept_scheme_name[0].upper() + concept_scheme_name[1:]
+    # Debug: temporarily removed sdmx-concept:Concept
+#   concept_head = f""" a skos:Concept, sdmx-concept:Concept, {NEW_PREF_CODE}:{concept_class_name};
+    concept_head = f""" a skos:Concept, {NEW_PREF_CODE}:{concept_class_name};
+    skos:topConceptOf {scheme_id} ;
+    skos:inScheme {scheme_id} ;\n"""
+    return scheme_id, concept_head
 
 def get_concept_str(concept_scheme_name: str, code: str, agencies: list, agency_labels: list) -> str:
     """Generates a Turtle RDF string for a concept belonging to a given scheme and code.
@@ -575,29 +732,26 @@ def get_concept_str(concept_scheme_name: str, code: str, agencies: list, agency_
     # => Turtle string of the concept with multiple agency labels and exactMatch
     """
 
-    concept_id = f"{NEW_PREF_CODE}:{concept_scheme_name}-{code}"
-    concept_class_name = concept_scheme_name[0].upper() + concept_scheme_name[1:]
+    scheme_id, concept_head = _concept_prefixes(concept_scheme_name)
+    concept_id = f"{scheme_id}-{code}"
 
-    # Debug: temporarily removed sdmx-concept:Concept
-#   concept_str = f"""{concept_id} a skos:Concept, sdmx-concept:Concept, {NEW_PREF_CODE}:{concept_class_name};
-    concept_str = f"""{concept_id} a skos:Concept, {NEW_PREF_CODE}:{concept_class_name};
-    skos:topConceptOf {NEW_PREF_CODE}:{concept_scheme_name} ;
-    skos:inScheme {NEW_PREF_CODE}:{concept_scheme_name} ;
-    skos:notation \"{code}\" ;
-    skos:prefLabel {Literal(agencies[0]['codeDescription']).n3()}@en ;\n"""
+    label_n3 = _lit_n3(agencies[0]['codeDescription'])
+    parts = [concept_id, concept_head, f"""    skos:notation \"{code}\" ;
+    skos:prefLabel {label_n3}@en ;\n"""]
 
     if len(agency_labels) == 0:
-        concept_str = concept_str + f"    rdfs:label {Literal(agencies[0]['codeDescription']).n3()}@en .\n\n"
+        parts.append(f"    rdfs:label {label_n3}@en .\n\n")
     else:
-        concept_str = concept_str + f"    {NEW_PREF}:hasAgencyLabel {',\n                      '.join(agency_labels)} .\n\n"
+        parts.append(f"    {NEW_PREF}:hasAgencyLabel {',\n                      '.join(agency_labels)} .\n\n")
 
     # Add skos:exactMatch if the concept is aligned with SDMX
-    if (concept_scheme_name in SDMX_CODES.keys()) and (code in SDMX_CODES[concept_scheme_name]):
-        concept_str = concept_str + f"{concept_id} skos:exactMatch <{SDMX_CODE_URI}-{code}> .\n"
+    sdmx_codes = SDMX_CODES.get(concept_scheme_name)
+    if sdmx_codes is not None and code in sdmx_codes:
+        parts.append(f"{concept_id} skos:exactMatch <{SDMX_CODE_URI}-{code}> .\n")
 
-    concept_str = concept_str + f"{NEW_PREF_CODE}:{concept_scheme_name} skos:hasTopConcept {concept_id} .\n\n"
+    parts.append(f"{scheme_id} skos:hasTopConcept {concept_id} .\n\n")
 
-    return concept_str
+    return "".join(parts)
 
 def get_code_description_dict(df: pd.DataFrame, codelists: list) -> dict:
     """Builds a dictionary of code descriptions for the given codelists.
@@ -637,9 +791,9 @@ def get_code_description_dict(df: pd.DataFrame, codelists: list) -> dict:
 
     Notes
     -----
-    - For each codelist, rows are filtered and grouped by the 'Code' field.
+    - Rows of the given codelists are filtered and grouped by the 'Code' field in one pass.
     - The same code may be described by multiple agencies (different records).
-    - Dictionary merging (|) is used to accumulate results for each codelist.
+    - Codes are returned in sorted order.
 
     Examples
     --------
@@ -654,23 +808,23 @@ def get_code_description_dict(df: pd.DataFrame, codelists: list) -> dict:
 
     description_dict = {}
     # Check required columns
-    required_columns = {"CodelistID", "Agency", "Code", "Code Description"}
-    if not required_columns.issubset(df.columns):
-        raise ValueError(f"DataFrame must contain columns: {required_columns}")
-
-    filtered_df = df[df['CodelistID'].isin(codelists)]
-    for code, group in filtered_df.groupby('Code'):
-        # Build dictionary in required structure for all unique codes
-        group_dict = {
-            code: [
-                {
-                    "agencyID": row['Agency'],
-                    "codeDescription": row['Code Description']
-                }
-                for _, row in group.iterrows()
-            ]
-        }
-
-        description_dict |= group_dict
+    if not _CODE_DESC_REQUIRED.issubset(df.columns):
+        raise ValueError(f"DataFrame must contain columns: {set(_CODE_DESC_REQUIRED)}")
+
+    filtered_df = df.loc[df['CodelistID'].isin(codelists), ['Code', 'Agency', 'Code Description']]
+    # Rows without a code are skipped, as groupby('Code') did
+    filtered_df = filtered_df[filtered_df['Code'].notna()]
+
+    # One pass over the columns; the per-code lists keep the row order
+    grouped = {}
+    for code, agency, code_description in zip(filtered_df['Code'], filtered_df['Agency'], filtered_df['Code Description']):
+        grouped.setdefault(code, []).append({
+            "agencyID": agency,
+            "codeDescription": code_description
+        })
+
+    # Codes in sorted order, as produced by groupby('Code')
+    for code in sorted(grouped):
+        description_dict[code] = grouped[code]
 
     return description_dict
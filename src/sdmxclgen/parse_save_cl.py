@@ -3,12 +3,166 @@
 # Copyright (c) 2025 Semantic R&D Group
 
 # parse_save_cl.py
+# ElementTree uses its C accelerator (_elementtree) automatically; no custom XMLParser/TreeBuilder
+# is passed anywhere, so the pure-Python parser is never forced
 import xml.etree.ElementTree as ET
 import re
+from collections import Counter
 import pandas as pd
-from .analyze_func import com_uniq_code, common_codes_def
+from .analyze_func import common_codes_def, count_codes_per_cl
 from .get_analyze_func import get_prefix_name_version
-from .templates import DF_CODE_COLUMNS, DF_CODE_LISTS_COLUMNS
+from .templates import DF_CODE_COLUMNS, DF_CODE_LISTS_COLUMNS, DESCRIPTION_NA
+
+# Optional libxml2-based parser: codelists are streamed with lxml.etree.iterparse when it is installed
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
+# Namespaces of SDMX-ML 3.0 structure messages
+SDMX_NAMESPACES = {
+    'str': 'http://www.sdmx.org/resources/sdmxml/schemas/v3_0/structure',
+    'com': 'http://www.sdmx.org/resources/sdmxml/schemas/v3_0/common',
+    'msg': 'http://www.sdmx.org/resources/sdmxml/schemas/v3_0/message'
+}
+_STRUCTURES_TAG = f"{{{SDMX_NAMESPACES['msg']}}}Structures"
+_CODELISTS_TAG = f"{{{SDMX_NAMESPACES['str']}}}Codelists"
+_CODELIST_TAG = f"{{{SDMX_NAMESPACES['str']}}}Codelist"
+_CODE_TAG = f"{{{SDMX_NAMESPACES['str']}}}Code"
+_NAME_TAG = f"{{{SDMX_NAMESPACES['com']}}}Name"
+_DESCRIPTION_TAG = f"{{{SDMX_NAMESPACES['com']}}}Description"
+# ElementPath expressions of the ElementTree fallback, with the tags in Clark notation
+# (no prefix resolution through a namespaces dict on every call)
+_CODELISTS_PATH = f".//{_STRUCTURES_TAG}/{_CODELISTS_TAG}"
+_ANY_CODELIST_PATH = f".//{_CODELIST_TAG}"
+_ANY_CODE_PATH = f".//{_CODE_TAG}"
+_XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+# Codelist identifier inside the URN, e.g. "...Codelist=ESTAT:CL_COVERAGE_POP(1.1.0)"
+_URN_RE = re.compile(r"Codelist=([^:]+:[^)]+\))")
+
+# With lxml, the com:Name language filters of _code_row_lxml are compiled XPath predicates
+# (xml:lang is lowercased with translate(), which is enough to compare it with "en" and "en-")
+if lxml_etree is not None:
+    _EN_NAMES_XPATH = lxml_etree.XPath(
+        "com:Name[translate(@xml:lang, 'EN', 'en') = 'en'"
+        " or starts-with(translate(@xml:lang, 'EN', 'en'), 'en-')]",
+        namespaces=SDMX_NAMESPACES)
+    _NO_LANG_NAMES_XPATH = lxml_etree.XPath("com:Name[not(@xml:lang) or @xml:lang = '']",
+                                            namespaces=SDMX_NAMESPACES)
+
+
+def _code_row(code):
+    """Builds the row (code_value, code_description) of a str:Code element."""
+    code_value = code.get("id", "Unknown")
+
+    # Names are binned by language in one pass; names whose text is whitespace only
+    # are kept (as empty strings), names without text are skipped
+    en_names, no_lang_names, any_names = [], [], []
+    for e in code.findall(_NAME_TAG):
+        text = e.text
+        if not text:
+            continue
+        text = text.strip()
+        any_names.append(text)
+        lang = e.get(_XML_LANG, "").lower()
+        # Prefer English names (en, en-GB, en-US, etc.)
+        if lang == "en" or lang.startswith("en-"):
+            en_names.append(text)
+        # Include names with no language
+        elif not lang:
+            no_lang_names.append(text)
+
+    if en_names:
+        description_text = " | ".join(en_names)
+    elif no_lang_names:
+        description_text = " | ".join(no_lang_names)
+    else:
+        # Fallback to any non-empty Name, otherwise "No description"
+        description_text = " | ".join(any_names) if any_names else "No description"
+
+    return code_value, description_text
+
+
+def _code_row_lxml(code):
+    """lxml variant of `_code_row`: the names are filtered by language in libxml2 with XPath."""
+    code_value = code.get("id", "Unknown")
+
+    # Same preference as _code_row: English names, then names with no language, then any name
+    en_names = [e.text.strip() for e in _EN_NAMES_XPATH(code) if e.text]
+    if en_names:
+        description_text = " | ".join(en_names)
+    else:
+        no_lang_names = [e.text.strip() for e in _NO_LANG_NAMES_XPATH(code) if e.text]
+        if no_lang_names:
+            description_text = " | ".join(no_lang_names)
+        else:
+            any_names = [e.text.strip() for e in code.iterchildren(_NAME_TAG) if e.text]
+            description_text = " | ".join(any_names) if any_names else "No description"
+
+    return code_value, description_text
+
+
+def _codelist_id_of(codelist_elem):
+    """Returns (urn, codelist_id, agency) from the attributes of a str:Codelist element."""
+    urn = codelist_elem.get("urn", "Unknown")
+    match = _URN_RE.search(urn)
+    codelist_id = match.group(1) if match else "Unknown"
+    return urn, codelist_id, codelist_elem.get("agencyID", "Unknown")
+
+
+def _is_codelists_section(elem):
+    """True if an lxml element is a .//msg:Structures/str:Codelists section."""
+    parent = elem.getparent()
+    return elem.tag == _CODELISTS_TAG and parent is not None and parent.tag == _STRUCTURES_TAG \
+        and parent.getparent() is not None
+
+
+def _in_codelists_section(elem):
+    """True if an lxml element lies under a .//msg:Structures/str:Codelists section."""
+    parent = elem.getparent()
+    while parent is not None:
+        if _is_codelists_section(parent):
+            return True
+        parent = parent.getparent()
+    return False
+
+
+def _iter_first_codelist(xml_file):
+    """
+    Streams the first Codelist of .//msg:Structures/str:Codelists with lxml.etree.iterparse.
+
+    Returns (codelist_elem, codes): the Codelist element (its Code children already cleared)
+    and the code rows built by `_code_row_lxml`, or (None, []) if there is no such Codelist.
+    Parsing stops at the end of that Codelist (or of the first Codelists section).
+    """
+    codes = []
+    owner = None
+    in_codelist = False
+    # Comments are dropped as ElementTree does, so that a Name split by a comment keeps its whole text
+    for _, elem in lxml_etree.iterparse(xml_file, events=("end",), remove_comments=True,
+                                        tag=(_CODELISTS_TAG, _CODELIST_TAG, _CODE_TAG)):
+        tag = elem.tag
+        if tag == _CODE_TAG:
+            parent = elem.getparent()
+            if parent is not owner:
+                # Whether the code lies inside a Codelist (codes are usually its direct children)
+                owner = parent
+                codelist = parent
+                while codelist is not None and codelist.tag != _CODELIST_TAG:
+                    codelist = codelist.getparent()
+                in_codelist = codelist is not None
+            if in_codelist:
+                codes.append(_code_row_lxml(elem))
+            # Free the names and annotations of the finished code
+            elem.clear()
+        elif tag == _CODELIST_TAG:
+            if _in_codelists_section(elem):
+                return elem, codes
+            codes = []
+        elif _is_codelists_section(elem):
+            # The first Codelists section ended without a Codelist
+            return None, []
+    return None, []
 
 
 def parse_codelist_v3(xml_file):
@@ -40,8 +194,8 @@ def parse_codelist_v3(xml_file):
         - urn : str
             Full URN (if present in the Codelist attributes).
         - codes : list
-            A list of lists, where each sublist describes a code:
-            [codelist_id, agency, code_value, code_description].
+            A list of tuples, where each tuple describes a code of the codelist:
+            (code_value, code_description); codelist_id and agency are not repeated per code.
 
     Raises
     ------
@@ -50,11 +204,13 @@ def parse_codelist_v3(xml_file):
 
     Notes
     -----
-    1. Uses `xml.etree.ElementTree` for parsing.
+    1. Uses `lxml.etree.iterparse` (if installed) to stream the file up to the end of the Codelist,
+       clearing finished Code elements; otherwise `xml.etree.ElementTree` parses the whole tree.
     2. The function searches for Codelist and Code elements along paths where
        the Codelist is expected under .//msg:Structures/str:Codelists/str:Codelist.
     3. If no Codelist element is found, a warning is printed and default "Unknown" fields are returned.
-    4. The `analyze_func` module is used to parse the identifier via `get_prefix_name_version`.
+    4. The `analyze_func` module is used to parse the identifier via `get_prefix_name_version`
+       (memoized there, so no extra cache is kept in this module).
 
     Examples
     --------
@@ -63,82 +219,53 @@ def parse_codelist_v3(xml_file):
     ESTAT:CL_COVERAGE_POP(1.1.0)
     """
     try:
-        tree = ET.parse(xml_file)
-        root = tree.getroot()
-
-        namespace = {
-            'str': 'http://www.sdmx.org/resources/sdmxml/schemas/v3_0/structure',
-            'com': 'http://www.sdmx.org/resources/sdmxml/schemas/v3_0/common',
-            'msg': 'http://www.sdmx.org/resources/sdmxml/schemas/v3_0/message'
-        }
-
-        # Search for the codelists section
-        codelists_section = root.find(".//msg:Structures/str:Codelists", namespace)
-        if codelists_section is not None:
-            codelist_elem = codelists_section.find(".//str:Codelist", namespace)
+        if lxml_etree is not None:
+            codelist_elem, codes = _iter_first_codelist(xml_file)
         else:
-            codelist_elem = None
+            tree = ET.parse(xml_file)
+            root = tree.getroot()
+
+            # Search for the codelists section
+            codelists_section = root.find(_CODELISTS_PATH)
+            if codelists_section is not None:
+                codelist_elem = codelists_section.find(_ANY_CODELIST_PATH)
+            else:
+                codelist_elem = None
+            codes = None
 
         if codelist_elem is not None:
-            urn = codelist_elem.get("urn", "Unknown")
-            match = re.search(r"Codelist=([^:]+:[^)]+\))", urn)
-            codelist_id = match.group(1) if match else "Unknown"
+            urn, codelist_id, agency = _codelist_id_of(codelist_elem)
 
-            codelist_name_elem = codelist_elem.find("com:Name", namespace)
+            codelist_name_elem = codelist_elem.find(_NAME_TAG)
             codelist_name = codelist_name_elem.text if codelist_name_elem is not None else "No name available"
 
-            agency = codelist_elem.get("agencyID", "Unknown")
             cl_id = codelist_elem.get("id", "Unknown")
 
             # Extract version from identifier
             _, _, _, cl_ver, _ = get_prefix_name_version(codelist_id)
 
-            description_elem = codelist_elem.find("com:Description", namespace)
-            codelist_description = description_elem.text if description_elem is not None else "Description not available"
+            description_elem = codelist_elem.find(_DESCRIPTION_TAG)
+            codelist_description = description_elem.text if description_elem is not None else DESCRIPTION_NA
         else:
             print(f"Warning! No <Codelist> element found in {xml_file}")
             codelist_id = "Unknown"
             codelist_name = "Unknown"
             agency = "Unknown"
             cl_id = "Unknown"
-            codelist_description = "Description not available"
+            codelist_description = DESCRIPTION_NA
 
-        codes = []
-        if codelist_elem is not None:
-            code_elems = codelist_elem.findall(".//str:Code", namespace)
-        else:
-            code_elems = []
-
-        for code in code_elems:
-            code_value = str(code.get("id", "Unknown"))
-            name_elems = code.findall("com:Name", namespace)
-
-            def lang_of(elem):
-                return elem.attrib.get("{http://www.w3.org/XML/1998/namespace}lang", "").lower()
-
-            # Prefer English names (en, en-GB, en-US, etc.)
-            en_names = [e.text.strip() for e in name_elems
-                        if e.text and (lang_of(e) == "en" or lang_of(e).startswith("en-"))]
-            # Include names with no language
-            no_lang_names = [e.text.strip() for e in name_elems
-                             if e.text and lang_of(e) == ""]
-
-            if en_names:
-                description_text = " | ".join(en_names)
-            elif no_lang_names:
-                description_text = " | ".join(no_lang_names)
+        if codes is None:
+            if codelist_elem is not None:
+                code_elems = codelist_elem.findall(_ANY_CODE_PATH)
             else:
-                # Fallback to any non-empty Name, otherwise "No description"
-                any_names = [e.text.strip() for e in name_elems if e.text]
-                description_text = " | ".join(any_names) if any_names else "No description"
-
-            codes.append([codelist_id, agency, code_value, str(description_text)])
+                code_elems = []
+            codes = [_code_row(code) for code in code_elems]
 
         return codelist_id, codelist_name, agency, cl_id, cl_ver, codelist_description, urn, codes
 
     except Exception as e:
         print(f"Error while processing {xml_file}: {e}")
-        return None, "Unknown", "Description not available", []
+        return None, "Unknown", DESCRIPTION_NA, []
 
 
 def save_codelist_data(codelists, cl_data_csv, cl_table_csv, save_flag=True):
@@ -173,9 +300,10 @@ def save_codelist_data(codelists, cl_data_csv, cl_table_csv, save_flag=True):
      -----
      1. First, the function computes the total number of codes and unique codes
         using `common_codes_def` from the `analyze_func` module.
-     2. For each codelist, the set of its codes is computed, as well as duplicates.
-        If duplicates are found, a warning is printed.
-     3. Using `com_uniq_code` from `analyze_func`, unique, common, and intersecting codes are determined.
+     2. The numbers of distinct, unique and common codes of all codelists are counted at once
+        with `count_codes_per_cl` from `analyze_func`; intersecting codes are derived from them.
+     3. Codelists with fewer distinct codes than code entries have duplicates: for each of them,
+        a warning is printed.
      4. Final data is written to two CSV files: `cl_data_csv` (code list) and `cl_table_csv` (summary table).
      5. If `save_flag=False`, no files are saved, but DataFrames are returned.
 
@@ -196,8 +324,8 @@ def save_codelist_data(codelists, cl_data_csv, cl_table_csv, save_flag=True):
     ...         "simcl": "Similar CL info ...",
     ...         "url": "http://example.com/coverage_pop",
     ...         "codes": [
-    ...             ["ESTAT:CL_COVERAGE_POP(1.1.0)", "ESTAT", "POP1", "Population 1"],
-    ...             ["ESTAT:CL_COVERAGE_POP(1.1.0)", "ESTAT", "POP2", "Population 2"]
+    ...             ("POP1", "Population 1"),
+    ...             ("POP2", "Population 2")
     ...         ]
     ...     }
     ... }
@@ -208,9 +336,13 @@ def save_codelist_data(codelists, cl_data_csv, cl_table_csv, save_flag=True):
     >>> print(df_codes.head())
     """
     # Collect all codes and identify common codes (e.g., _Z or numeric)
-    all_codes, common_codes = common_codes_def(codelists)
-    all_codes_count = len(all_codes)
-    unique_codes_count = len(set(all_codes))
+    _, common_codes = common_codes_def(codelists, return_all_codes=False)
+    all_codes_count = sum(len(data["codes"]) for codelist_id, data in codelists.items() if codelist_id is not None)
+    unique_codes_count = len({
+        entry[0]
+        for codelist_id, data in codelists.items() if codelist_id is not None
+        for entry in data["codes"]
+    })
 
     print("Codelists:", len(codelists))
     print(f"Total number of codes: {all_codes_count}")
@@ -219,56 +351,48 @@ def save_codelist_data(codelists, cl_data_csv, cl_table_csv, save_flag=True):
     s.sort()
     print(f"Common codes: {s}")
 
-    codes_data = []
-    code_lists = []
+    # Columns of the code table, filled codelist by codelist
+    cl_ids, agencies, codes_data, descs = [], [], [], []
     for codelist_id, data in codelists.items():
         if codelist_id is None:
             continue
+        # Code rows are (code_value, code_description): the codelist and agency columns
+        # of the code table are filled with the values of the codelist
+        n_codes = len(data["codes"])
+        cl_ids.extend([codelist_id] * n_codes)
+        agencies.extend([data["agency"]] * n_codes)
+        codes_data.extend(entry[0] for entry in data["codes"])
+        descs.extend(entry[1] for entry in data["codes"])
+    df_codes = pd.DataFrame(dict(zip(DF_CODE_COLUMNS, (cl_ids, agencies, codes_data, descs))))
+    # The frame holds its own copies of the columns: the lists are freed before the CSV files
+    # are written (the peak of the function), instead of living until it returns
+    del cl_ids, agencies, codes_data, descs
+
+    # Numbers of distinct, unique and common codes of every codelist (computed once, vectorized)
+    code_counts = count_codes_per_cl(codelists, common_codes)
+
+    # Duplicates are listed only for the codelists that have any
+    for codelist_id in code_counts.index[code_counts["total"].to_numpy() != code_counts["size"].to_numpy()]:
+        codes_col = [entry[0] for entry in codelists[codelist_id]["codes"]]
+        duplicates = {code for code, count in Counter(codes_col).items() if count > 1}
+        print(f"Warning: Duplicates found in {codelist_id}: {duplicates}")
 
-        codelist_name = data["name"]
-        agency = data["agency"]
-        cl_id = data["clid"]
-        cl_ver = data["ver"]
-        codelist_description = data["description"]
-        sim_cl = data["simcl"]
-        url = data["url"]
-
-        # Build the set of codes for the current codelist
-        code_set = set()
-        duplicates = set()
-        for entry in data["codes"]:
-            if entry[2] in code_set:
-                duplicates.add(entry[2])
-            else:
-                code_set.add(entry[2])
-
-        if duplicates:
-            print(f"Warning: Duplicates found in {codelist_id}: {duplicates}")
-
-        # Add code data for DataFrame
-        codes_data.extend([[codelist_id, agency, entry[2], entry[3]] for entry in data["codes"]])
-
-        total_codes_count = len(code_set)
+    code_lists = []
+    for codelist_id, total_codes_count, uniq_codes_count, common_codes_count in zip(
+            code_counts.index, code_counts["total"].tolist(), code_counts["unique"].tolist(),
+            code_counts["common"].tolist()):
+        data = codelists[codelist_id]
 
         # Determine overlapping codes relative to other codelists
-        code_set, common_code_set, unique_codes_set = com_uniq_code(codelists, common_codes,
-                                                                    unique_codes_count, codelist_id,
-                                                                    code_set)
-
-        uniq_codes_count = len(unique_codes_set)
-        common_codes_count = len(common_code_set)
-
         shared_codes_count = total_codes_count - uniq_codes_count - common_codes_count
 
         code_lists.append([
-            codelist_id, "", "", codelist_name, codelist_description, agency, cl_id,
-            cl_ver, total_codes_count, uniq_codes_count, common_codes_count,
-            shared_codes_count, sim_cl, url
+            codelist_id, "", "", data["name"], data["description"], data["agency"], data["clid"],
+            data["ver"], total_codes_count, uniq_codes_count, common_codes_count,
+            shared_codes_count, data["simcl"], data["url"]
         ])
-
-    # Create DataFrames
-    df_codes = pd.DataFrame(codes_data, columns=DF_CODE_COLUMNS)
     df_code_lists = pd.DataFrame(code_lists, columns=DF_CODE_LISTS_COLUMNS)
+    del code_lists, code_counts
 
     # Save to CSV files if required
     if save_flag:
@@ -3,14 +3,198 @@
 # Copyright (c) 2025 Semantic R&D Group
 
 # quality_check.py
+import hashlib
 import os
-from rdflib import Graph, Namespace
-from rdflib.namespace import RDFS, SKOS
+import pickle
+import re
+from concurrent.futures import ProcessPoolExecutor
+from rdflib import BNode, Graph, Literal, Namespace, URIRef
+from rdflib.namespace import RDFS, SKOS, XSD
 from .gen_template import NEW_PREF_CODE, NEW_PURL
+
+# Optional Rust-based RDF parser (pyoxigraph >= 0.5, which exposes the parsed prefixes);
+# without it, or with an older release, rdflib is used
+try:
+    import pyoxigraph
+except ImportError:
+    pyoxigraph = None
+else:
+    if not (hasattr(pyoxigraph, "RdfFormat") and hasattr(getattr(pyoxigraph, "QuadParser", None), "prefixes")):
+        pyoxigraph = None
+
+# Namespace of the new model, created once at import
+NEW_NS = Namespace(f"{NEW_PURL}")
+
+# Terms looked up while collecting the facts of a graph, built once at import
+# (each Namespace attribute access creates a new URIRef)
+_HAS_AGENCY_LABEL = NEW_NS.hasAgencyLabel
+# Fact key -> predicate whose subjects are collected
+_SUBJECT_PREDICATES = (("labelled", RDFS.label), ("pref_labelled", SKOS.prefLabel),
+                       ("in_scheme", SKOS.inScheme), ("commented", RDFS.comment))
+_EXTERNAL_PREDICATES = frozenset((RDFS.seeAlso, SKOS.exactMatch))
+if pyoxigraph is not None:
+    _OX_SUB_CLASS_OF = pyoxigraph.NamedNode(str(RDFS.subClassOf))
+    _OX_CONCEPT = pyoxigraph.NamedNode(str(SKOS.Concept))
+    _OX_HAS_AGENCY_LABEL = pyoxigraph.NamedNode(str(_HAS_AGENCY_LABEL))
+    _OX_NOTATION = pyoxigraph.NamedNode(str(SKOS.notation))
+    _OX_SUBJECT_PREDICATES = tuple((key, pyoxigraph.NamedNode(str(p))) for key, p in _SUBJECT_PREDICATES)
+    _OX_EXTERNAL_PREDICATES = frozenset(pyoxigraph.NamedNode(str(p)) for p in _EXTERNAL_PREDICATES)
+
+# Explicit xsd:string datatype ("x"^^xsd:string): rdflib keeps such literals apart from "x",
+# pyoxigraph (RDF 1.1) does not. May also match inside a literal, which only costs the fallback.
+_EXPLICIT_STRING_RE = re.compile(rb'\^\^\s*(?:<[^>\s]*#string>|[\w.-]*:string\b)')
+
+# Prefixes every model is expected to declare and use
+_REQUIRED_PREFIXES = {
+    "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
+    "skos": "http://www.w3.org/2004/02/skos/core#",
+    f"{NEW_PREF_CODE}": f"{NEW_PURL}/code#"
+}
+
+# Directory of cached quality reports (keyed by the SHA-1 of the checked file)
+QUALITY_CACHE_DIR = ".rdfq_cache"
+# Bump when check_rdf_quality changes, so that older cached reports are not reused
+QUALITY_CACHE_VERSION = 3
+
 # OWL is not explicitly used but may be useful. Keep it if needed:
 # from rdflib.namespace import OWL
 
 
+def _namespaces_of(uris):
+    """Namespaces "...#" (up to the first '#') of the given URI strings."""
+    return {uri.partition("#")[0] + "#" for uri in uris if "#" in uri}
+
+
+def _graph_facts_rdflib(file_path):
+    """
+    Parses a Turtle file with rdflib and collects, in a single traversal of the graph,
+    the terms and counts that check_rdf_quality derives its checks from.
+
+    Returns
+    -------
+    dict
+        - "declared_prefixes": dict, prefix -> namespace URI (rdflib's default bindings
+          are included, as rdflib reports them for every graph);
+        - "used_namespaces": set, namespaces "...#" of the URIs of the graph;
+        - "concepts", "agency_labels": list, subjects of rdfs:subClassOf skos:Concept and
+          objects of hasAgencyLabel, in the order of the graph;
+        - "labelled", "pref_labelled", "in_scheme", "commented": set, subjects of rdfs:label,
+          skos:prefLabel, skos:inScheme and rdfs:comment;
+        - "notations": set, values (lexical forms, as plain str) of skos:notation;
+        - "external_links": int, number of rdfs:seeAlso and skos:exactMatch triples;
+        - "unique_subjects", "unique_predicates", "unique_objects": set, distinct terms.
+    """
+    g = Graph()
+    g.parse(file_path, format="turtle")
+
+    # Concepts and agency labels are listed in the report, so they are taken from the
+    # (pattern-indexed) lookups, which keep the order of the triples in the graph
+    facts = {
+        "declared_prefixes": {prefix: str(uri) for prefix, uri in g.namespaces()},
+        "concepts": list(g.subjects(RDFS.subClassOf, SKOS.Concept)),
+        "agency_labels": list(g.objects(None, _HAS_AGENCY_LABEL)),
+        "unique_subjects": set(), "unique_predicates": set(), "unique_objects": set(),
+        "labelled": set(), "pref_labelled": set(), "in_scheme": set(), "commented": set(),
+        "notations": set(),
+    }
+    unique_subjects, unique_predicates, unique_objects = (
+        facts["unique_subjects"], facts["unique_predicates"], facts["unique_objects"])
+    # Predicates are dispatched through dicts (one hash per triple, no chain of term comparisons)
+    subjects_by_predicate = {p: facts[key] for key, p in _SUBJECT_PREDICATES}
+    # Objects are stored as plain str: only their distinct values are counted,
+    # and str hashing avoids the Python-level hash/eq of rdflib Literals
+    objects_by_predicate = {SKOS.notation: facts["notations"]}
+    external_predicates = _EXTERNAL_PREDICATES
+    external_links = 0
+    for s, p, o in g:
+        unique_subjects.add(s)
+        unique_predicates.add(p)
+        unique_objects.add(o)
+        if p in subjects_by_predicate:
+            subjects_by_predicate[p].add(s)
+        elif p in objects_by_predicate:
+            objects_by_predicate[p].add(str(o))
+        elif p in external_predicates:
+            external_links += 1
+    facts["external_links"] = external_links
+
+    facts["used_namespaces"] = _namespaces_of(
+        str(term) for terms in (unique_subjects, unique_predicates, unique_objects) for term in terms
+        if isinstance(term, URIRef))
+    return facts
+
+
+def _rdflib_term(term):
+    """Converts a pyoxigraph term into the rdflib term that rdflib's Turtle parser yields for it."""
+    if isinstance(term, pyoxigraph.NamedNode):
+        return URIRef(term.value)
+    if isinstance(term, pyoxigraph.BlankNode):
+        return BNode(term.value)
+    if term.language:
+        return Literal(term.value, lang=term.language)
+    # rdflib keeps simple literals without a datatype, RDF 1.1 (pyoxigraph) types them xsd:string;
+    # files with explicit xsd:string literals are not parsed with pyoxigraph (see _graph_facts_oxigraph)
+    datatype = term.datatype.value
+    return Literal(term.value, datatype=None if datatype == str(XSD.string) else datatype)
+
+
+def _graph_facts_oxigraph(file_path):
+    """
+    pyoxigraph variant of _graph_facts_rdflib: the triples are streamed from the Turtle parser
+    and collected in the same single pass, without building a graph. Concepts and agency labels
+    are listed in the order of the file; terms are pyoxigraph terms (check_rdf_quality converts
+    the ones it reports to rdflib terms).
+
+    Returns None if the file may contain explicit xsd:string literals, which pyoxigraph merges with
+    the plain ones: the caller then uses _graph_facts_rdflib, so that both give the same counts.
+    """
+    with open(file_path, "rb") as f:
+        data = f.read()
+    if _EXPLICIT_STRING_RE.search(data):
+        return None
+
+    facts = {
+        "concepts": [], "agency_labels": [],
+        "unique_subjects": set(), "unique_predicates": set(), "unique_objects": set(),
+        "labelled": set(), "pref_labelled": set(), "in_scheme": set(), "commented": set(),
+        "notations": set(),
+    }
+    concepts, agency_labels = facts["concepts"], facts["agency_labels"]
+    unique_subjects, unique_predicates, unique_objects = (
+        facts["unique_subjects"], facts["unique_predicates"], facts["unique_objects"])
+    subjects_by_predicate = {p: facts[key] for key, p in _OX_SUBJECT_PREDICATES}
+    objects_by_predicate = {_OX_NOTATION: facts["notations"]}
+    external_predicates = _OX_EXTERNAL_PREDICATES
+    external_links = 0
+
+    parser = pyoxigraph.parse(input=data, format=pyoxigraph.RdfFormat.TURTLE)
+    for quad in parser:
+        s, p, o = quad.subject, quad.predicate, quad.object
+        unique_subjects.add(s)
+        unique_predicates.add(p)
+        unique_objects.add(o)
+        if p in subjects_by_predicate:
+            subjects_by_predicate[p].add(s)
+        elif p in objects_by_predicate:
+            objects_by_predicate[p].add(o.value)
+        elif p in external_predicates:
+            external_links += 1
+        elif p == _OX_SUB_CLASS_OF:
+            if o == _OX_CONCEPT:
+                concepts.append(s)
+        elif p == _OX_HAS_AGENCY_LABEL:
+            agency_labels.append(o)
+    facts["external_links"] = external_links
+
+    declared_prefixes = {prefix: str(uri) for prefix, uri in Graph().namespaces()}
+    declared_prefixes.update(parser.prefixes)
+    facts["declared_prefixes"] = declared_prefixes
+    facts["used_namespaces"] = _namespaces_of(
+        term.value for terms in (unique_subjects, unique_predicates, unique_objects) for term in terms
+        if isinstance(term, pyoxigraph.NamedNode))
+    return facts
+
+
 def check_rdf_quality(file_path):
     """
     Checks the quality of an RDF model for compliance with basic requirements:
@@ -36,7 +220,9 @@ def check_rdf_quality(file_path):
         - "inconsistent_concepts": list
             Concepts missing the SKOS.inScheme property.
         - "diverse_notation_count": int
-            Number of distinct SKOS.notation values.
+            Number of distinct SKOS.notation values, compared by lexical form:
+            notations that differ only by datatype or language tag ("1", "1"^^xsd:integer,
+            "1"@en) count once. Fewer than 5 lowers quality_score by 10.
         - "descriptive_labels_count": int
             Number of concepts that have RDFS.comment.
         - "external_links_count": int
@@ -56,10 +242,14 @@ def check_rdf_quality(file_path):
 
     Notes
     -----
-    1. Loads the RDF graph using rdflib (format "turtle").
+    1. Loads the RDF graph using pyoxigraph if it is installed (the triples are streamed from its
+       Turtle parser), otherwise rdflib (format "turtle"), which is also used for files with explicit
+       xsd:string literals so that both give the same report; the checks are derived from the terms
+       collected in a single pass over the triples. The structural checks (labels, agency links)
+       use the same pass as the counts, so no separate count-only parse is made.
     2. Checks required prefixes ("rdfs", "skos", "NEW_PREF_CODE").
        - If not declared, registers them in missing_prefixes.
-       - If declared but never used, registers them in unused_prefixes.
+       - If declared but never used by a URI of the graph, registers them in unused_prefixes.
     3. Checks concept consistency: presence of SKOS.prefLabel, SKOS.inScheme, etc.
     4. Produces final scores (score, quality_score_10, value_score_10), reducing points for “problems”
        and considering diversity (SKOS.notation), external links (RDFS.seeAlso, SKOS.exactMatch), etc.
@@ -70,51 +260,50 @@ def check_rdf_quality(file_path):
     >>> print(report["quality_score"], report["missing_prefixes"])
     85 ['NEW_PREF_CODE']
     """
-    g = Graph()
-    g.parse(file_path, format="turtle")
-
-    NEW_NS = Namespace(f"{NEW_PURL}")
+    facts = _graph_facts_oxigraph(file_path) if pyoxigraph is not None else None
+    from_oxigraph = facts is not None
+    if not from_oxigraph:
+        facts = _graph_facts_rdflib(file_path)
+    concepts, agency_labels = facts["concepts"], facts["agency_labels"]
+    labelled, pref_labelled = facts["labelled"], facts["pref_labelled"]
+    in_scheme, commented = facts["in_scheme"], facts["commented"]
+    external_links = facts["external_links"]
+    unique_subjects, unique_predicates, unique_objects = (
+        facts["unique_subjects"], facts["unique_predicates"], facts["unique_objects"])
 
     # Check 1: Required prefixes
-    required_prefixes = {
-        "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
-        "skos": "http://www.w3.org/2004/02/skos/core#",
-        f"{NEW_PREF_CODE}": f"{NEW_PURL}/code#"
-    }
-    declared_prefixes = {prefix: uri for prefix, uri in g.namespaces()}
+    declared_prefixes = facts["declared_prefixes"]
     missing_prefixes = []
-    for ns, uri in required_prefixes.items():
+    for ns, uri in _REQUIRED_PREFIXES.items():
         if ns not in declared_prefixes and uri not in declared_prefixes.values():
             missing_prefixes.append(ns)
 
     # Check 2: Prefix usage
-    unused_prefixes = [ns for ns, uri in required_prefixes.items()
-                       if all(uri not in str(s) for s in g)]
+    # (every required prefix URI ends with its only '#')
+    unused_prefixes = [ns for ns, uri in _REQUIRED_PREFIXES.items() if uri not in facts["used_namespaces"]]
 
     # Check 3: Concept structure
-    concepts = list(g.subjects(RDFS.subClassOf, SKOS.Concept))
-    missing_labels = [concept for concept in concepts if not list(g.objects(concept, SKOS.prefLabel))]
+    missing_labels = [concept for concept in concepts if concept not in pref_labelled]
 
     # Check 4: Agency links (NEW_NS.hasAgencyLabel)
-    agency_labels = list(g.objects(None, NEW_NS.hasAgencyLabel))
-    missing_agency_links = [label for label in agency_labels if not list(g.objects(label, RDFS.label))]
+    missing_agency_links = [label for label in agency_labels if label not in labelled]
 
     # Check 5: Presence of skos:inScheme
-    inconsistent_concepts = [concept for concept in concepts if not list(g.objects(concept, SKOS.inScheme))]
+    inconsistent_concepts = [concept for concept in concepts if concept not in in_scheme]
 
     # Check 6: Diversity (SKOS.notation)
-    diverse_notations = len(set(g.objects(None, SKOS.notation)))
+    diverse_notations = len(facts["notations"])
 
     # Check 7: Descriptive labels (RDFS.comment)
-    descriptive_labels = len([concept for concept in concepts if list(g.objects(concept, RDFS.comment))])
+    descriptive_labels = sum(1 for concept in concepts if concept in commented)
 
-    # Check 8: Interoperability (RDFS.seeAlso, SKOS.exactMatch)
-    external_links = len(list(g.objects(None, RDFS.seeAlso))) + len(list(g.objects(None, SKOS.exactMatch)))
+    # Check 8: Interoperability (RDFS.seeAlso, SKOS.exactMatch): external_links, counted above
 
-    # Count unique subjects, predicates, objects
-    unique_subjects = set(g.subjects())
-    unique_predicates = set(g.predicates())
-    unique_objects = set(g.objects())
+    # Reported terms are rdflib terms, whichever parser was used
+    if from_oxigraph:
+        missing_labels = [_rdflib_term(term) for term in missing_labels]
+        missing_agency_links = [_rdflib_term(term) for term in missing_agency_links]
+        inconsistent_concepts = [_rdflib_term(term) for term in inconsistent_concepts]
 
     # Final quality score calculation
     score = 100
@@ -175,7 +364,55 @@ def check_rdf_quality(file_path):
     return report
 
 
-def process_all_models(directory):
+def check_rdf_quality_cached(file_path, cache_dir=QUALITY_CACHE_DIR):
+    """
+    Same as ``check_rdf_quality``, but reuses the report of a file with identical content.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the Turtle file (.ttl) containing the RDF model to be checked.
+    cache_dir : str or None
+        Directory for cached reports (default: `QUALITY_CACHE_DIR`). None disables the cache.
+
+    Returns
+    -------
+    dict
+        Quality report (see check_rdf_quality).
+
+    Notes
+    -----
+    1. The key is the SHA-1 of the file bytes (and `QUALITY_CACHE_VERSION`), so an unchanged
+       TTL regenerated on a later run is not parsed again; the modification time is not used.
+    2. Reports are pickled, so that rdflib terms in them (e.g. missing_labels) are kept as is.
+    3. A report is written to a temporary file and renamed, so parallel workers never read
+       a partially written entry; an unreadable entry is recomputed.
+    """
+    if cache_dir is None:
+        return check_rdf_quality(file_path)
+
+    with open(file_path, "rb") as f:
+        digest = hashlib.sha1(f.read()).hexdigest()
+    cache_path = os.path.join(cache_dir, f"v{QUALITY_CACHE_VERSION}-{digest}.pkl")
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    report = check_rdf_quality(file_path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(report, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Warning: quality report of {file_path} not cached: {e}")
+    return report
+
+
+def process_all_models(directory, workers=None):
     """
     Iterates over the given directory and runs quality checks for all .ttl RDF models.
 
@@ -183,6 +420,9 @@ def process_all_models(directory):
     ----------
     directory : str
         Path to the directory containing Turtle files to check.
+    workers : int, optional
+        Number of worker processes for the checks
+        (default: ``os.cpu_count()``; 1 checks in the current process).
 
     Returns
     -------
@@ -192,7 +432,10 @@ def process_all_models(directory):
 
     Notes
     -----
-    1. Detects files with the .ttl extension and passes them to `check_rdf_quality`.
+    1. Detects files with the .ttl extension (``os.scandir``, directories are skipped)
+       and passes them to `check_rdf_quality`.
+       Files are independent, so they are checked in a process pool (rdflib parsing is CPU-bound
+       and holds the GIL); callers running it as a script need an ``if __name__ == "__main__"`` guard.
     2. Returns a summary report containing information about all checked models.
 
     Examples
@@ -201,10 +444,16 @@ def process_all_models(directory):
     >>> for filename, report in reports.items():
     ...     print(filename, report["quality_score"])
     """
-    reports = {}
-    for filename in os.listdir(directory):
-        if filename.endswith(".ttl"):
-            file_path = os.path.join(directory, filename)
-            report = check_rdf_quality(file_path)
-            reports[filename] = report
-    return reports
+    with os.scandir(directory) as it:
+        entries = [(entry.name, entry.path) for entry in it if entry.name.endswith(".ttl") and entry.is_file()]
+    filenames = [name for name, _ in entries]
+    file_paths = [path for _, path in entries]
+
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(file_paths) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(file_paths))) as ex:
+            results = list(ex.map(check_rdf_quality, file_paths))
+    else:
+        results = [check_rdf_quality(file_path) for file_path in file_paths]
+
+    return dict(zip(filenames, results))
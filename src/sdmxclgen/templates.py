@@ -5,10 +5,14 @@
 # templates.py
 # Configuration module: contains definitions of columns, prefixes, URIs, and glossaries for working with SDMX models
 
+from types import MappingProxyType
 from rdflib import Namespace
 
 # from site import PREFIXES
 
+# Placeholder used when a codelist or concept has no description
+DESCRIPTION_NA = "Description not available"
+
 # Columns of the source file with codelists (in/Code_Lists_GR_SDMX.csv)
 DF_CL_SOURCE = ["agency_id", "codelistID", "Name", "URL"]
 
@@ -27,9 +31,9 @@ SDMX_PREF_CODE = "sdmx-code"
 SDMX_CODE_URI = "http://purl.org/linked-data/sdmx/2009/code#"
 
 # Set of SDMX ConceptSchemes (used for skos:exactMatch)
-SDMX_CONCEPT_SCHEMES = {'confStatus', 'obsStatus', 'area', 'decimals', 'currency',
-                        'sex', 'timeFormat', 'unitMult', 'freq'
-}
+SDMX_CONCEPT_SCHEMES = frozenset({'confStatus', 'obsStatus', 'area', 'decimals', 'currency',
+                                  'sex', 'timeFormat', 'unitMult', 'freq'
+})
 
 # Dictionary of valid SDMX codes by concept
 SDMX_CODES = {
@@ -42,6 +46,9 @@ SDMX_CODES = {
     'timeFormat': {'P1D', '702', '610', 'P3M', '602', '102', 'P1M', '711', 'P6M', 'PT1M', '716',
                    '704', '616', 'P1Y', '708', '604', 'P7D', '608', '710', '203', '719'}
 }
+# Frozen once at import: the code sets are only used for membership tests,
+# and the mapping itself is exposed read-only
+SDMX_CODES = MappingProxyType({concept: frozenset(codes) for concept, codes in SDMX_CODES.items()})
 
 # Grouping of SDMX schemes and related codelists (used when generating CL and TTL)
 SDMX_ConceptSchemes = {
@@ -57,6 +64,8 @@ SDMX_ConceptSchemes = {
     "sdmx-code:timeFormat": {"GroupType": "SINGLE", "codelists": ["SDMX:CL_TIME_FORMAT(1.0)"]},
     "sdmx-code:unitMult": {"GroupType": "SINGLE", "codelists": ["SDMX:CL_UNIT_MULT(1.1)"]},
 }
+# Read-only view: the grouping is configuration and is never modified at runtime
+SDMX_ConceptSchemes = MappingProxyType(SDMX_ConceptSchemes)
 
 # Mapping of schemes at the user level to concepts (for generating rdfs:seeAlso and skos:related)
 SDMX_SCHEME_CONCEPT_CL_ASS = {
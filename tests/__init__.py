@@ -0,0 +1,3 @@
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Semantic R&D Group
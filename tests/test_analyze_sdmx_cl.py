@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Semantic R&D Group
+
+import io
+import unittest
+
+import numpy as np
+import pandas as pd
+from pandas.io.parsers.readers import STR_NA_VALUES
+
+from src.sdmxclgen.analyze_sdmx_cl import CSV_NA_VALUES, _mask_csv_na
+
+
+class CsvNaValuesTest(unittest.TestCase):
+    """The in-memory NA masking of cl_analysis matches a to_csv/read_csv round trip."""
+
+    def test_matches_pandas_default_na_values(self):
+        self.assertEqual(CSV_NA_VALUES, frozenset(STR_NA_VALUES))
+
+    def test_mask_equals_csv_round_trip(self):
+        na_like = sorted(CSV_NA_VALUES)
+        df = pd.DataFrame({
+            "CodelistID": [f"A:CL_{i}(1.0)" for i in range(len(na_like) + 4)],
+            "Codelist Description": na_like + ["text", "na", " NA", None],
+            "Similar Codelists": [np.nan] * (len(na_like) + 3) + ["B:CL_X(1.0)"],
+            "Total Codes": range(len(na_like) + 4),
+        })
+        buf = io.StringIO()
+        df.to_csv(buf, index=False, sep=";")
+        buf.seek(0)
+        expected = pd.read_csv(buf, sep=";")
+
+        masked = _mask_csv_na(df)
+        pd.testing.assert_frame_equal(masked.isnull(), expected.isnull())
+        pd.testing.assert_series_equal(masked.isnull().sum(), expected.isnull().sum())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Semantic R&D Group
+
+import unittest
+
+from src.sdmxclgen import gen_template
+
+
+class SinglesTest(unittest.TestCase):
+    """SINGLES entries keep the dict-style access of the former SINGLES dicts."""
+
+    def test_entries_are_subscriptable_by_key(self):
+        entry = gen_template.SINGLES["freq"]
+        self.assertEqual(entry["codelist"], "SDMX:CL_FREQ(2.1)")
+        self.assertEqual(entry["label"], entry.label)
+        self.assertEqual(entry["description"], entry[2])
+        with self.assertRaises(KeyError):
+            entry["count"]
+
+    def test_concept_for(self):
+        self.assertEqual(gen_template.concept_for("SDMX:CL_FREQ(2.1)"), "freq")
+        self.assertIsNone(gen_template.concept_for("SDMX:CL_UNKNOWN(1.0)"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Semantic R&D Group
+
+import re
+import unittest
+
+from src.sdmxclgen import get_analyze_func
+
+# Identifier pattern, matched with Python's re (Unicode \d)
+_REFERENCE_RE = re.compile(r"(.*?):S?CL_([A-Z_]+?)(?:\d+)?\(([^)]+)\)")
+
+
+class ParseCodelistIdTest(unittest.TestCase):
+    """_parse_codelist_id splits identifiers as Python's re does, whichever engine is installed."""
+
+    def test_matches_re_semantics(self):
+        for codelist_id in (
+                "ESTAT:CL_ACTIVITY(1.11.0)", "ESTAT:SCL_COVERAGE_POP(1.1.0)", "ESTAT:CL_SECTOR93(1.4)",
+                "A:B:CL_FREQ(2.1)", "ESTAT:CL_FREQ٣(1.0)", "ESTAT:CL_A٣4(1.0)", "ÉTAT:CL_FREQ(1.0)",
+                "ESTAT:CL_FREQ", "ESTAT:CL_freq(1.0)", "ESTAT:CL_FREQ()",
+        ):
+            with self.subTest(codelist_id=codelist_id):
+                match = _REFERENCE_RE.match(codelist_id)
+                parsed = get_analyze_func._parse_codelist_id(codelist_id)
+                if match is None:
+                    self.assertIsNone(parsed)
+                else:
+                    prefix, _, name, version, _ = parsed
+                    self.assertEqual((prefix, name, version), match.groups())
+
+
+if __name__ == "__main__":
+    unittest.main()
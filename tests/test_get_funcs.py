@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Semantic R&D Group
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from src.sdmxclgen import gen_template, get_funcs
+from src.sdmxclgen.templates import DESCRIPTION_NA
+
+_TTL_HEAD = """@prefix ex: <http://example.org/> .
+@prefix skos: <http://www.w3.org/2004/02/skos/core#> .
+
+ex:s a skos:ConceptScheme .
+"""
+
+
+class GetSdmxSchemesCodesTest(unittest.TestCase):
+    """get_sdmx_schemes_codes on valid Turtle outside the generator's layout, with both parsers."""
+
+    def _schemes_codes(self, body, use_oxigraph):
+        fd, path = tempfile.mkstemp(suffix=".ttl")
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(_TTL_HEAD + body)
+        if use_oxigraph:
+            if get_funcs.pyoxigraph is None:
+                self.skipTest("pyoxigraph is not installed")
+            return get_funcs.get_sdmx_schemes_codes(path, use_cache=False)
+        with mock.patch.object(get_funcs, "pyoxigraph", None):
+            return get_funcs.get_sdmx_schemes_codes(path, use_cache=False)
+
+    def _check(self, body, expected_codes):
+        for use_oxigraph in (False, True):
+            with self.subTest(use_oxigraph=use_oxigraph):
+                schemes, codes = self._schemes_codes(body, use_oxigraph)
+                self.assertEqual(schemes, {"s"})
+                self.assertEqual(codes, expected_codes)
+
+    def test_nested_blank_node_notation_is_not_the_concept_notation(self):
+        self._check(
+            'ex:c a skos:Concept ;\n'
+            '    skos:inScheme ex:s ;\n'
+            '    skos:notation "X" ;\n'
+            '    ex:rel [\n'
+            '        skos:notation "Y" ;\n'
+            '        ex:p ex:o\n'
+            '    ] .\n',
+            {"http://example.org/s": {"X"}},
+        )
+
+    def test_second_prefix_bound_to_skos(self):
+        self._check(
+            '@prefix sk: <http://www.w3.org/2004/02/skos/core#> .\n'
+            'ex:c a skos:Concept ;\n'
+            '    skos:inScheme ex:s ;\n'
+            '    sk:notation "Z" .\n',
+            {"http://example.org/s": {"Z"}},
+        )
+
+
+class GetSinglesTemplateTest(unittest.TestCase):
+    """get_singles_template writes records that gen_template loads back unchanged."""
+
+    def setUp(self):
+        gen_template._singles_raw.cache_clear()
+        self.addCleanup(gen_template._singles_raw.cache_clear)
+
+    def test_round_trip(self):
+        df = pd.DataFrame({
+            "GroupType": ["SINGLE", "GROUP", "SINGLE", "SINGLE"],
+            "CL Name": ["Frequency", "Currency", 'Code list for "Frequency"', "Région"],
+            "CodelistID": ["SDMX:CL_FREQ(2.1)", "ECB:CL_CURRENCY(1.0)", "ESTAT:CL_FREQ(1.0)", "ESTAT:CL_REG(1.0)"],
+            "Codelist Description": ["Line 1\n line 2", "Currencies", DESCRIPTION_NA, "Régions d'Europe"],
+        })
+        fd, path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+
+        get_funcs.get_singles_template(df, path)
+        with mock.patch.object(gen_template, "SINGLES_FILE", path):
+            records = gen_template._singles_raw()
+
+        singles = df[df["GroupType"] == "SINGLE"]
+        self.assertEqual(
+            [(cl, label, desc) for _, cl, label, desc in records],
+            list(zip(singles["CodelistID"], singles["CL Name"], singles["Codelist Description"])),
+        )
+        keys = [key for key, _, _, _ in records]
+        self.assertEqual(len(set(keys)), len(keys))
+        self.assertIs(records[1][3], DESCRIPTION_NA)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Semantic R&D Group
+
+import importlib
+import os
+import sys
+import tempfile
+import types
+import unittest
+from unittest import mock
+
+from src.sdmxclgen import quality_check
+
+_TTL_TYPED_STRINGS = """@prefix ex: <http://example.org/> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix skos: <http://www.w3.org/2004/02/skos/core#> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+ex:c rdfs:subClassOf skos:Concept ;
+    skos:notation "x", "x"^^xsd:string ;
+    ex:p "y"^^<http://www.w3.org/2001/XMLSchema#string>, "y" .
+"""
+
+_TTL_TYPED_NOTATIONS = """@prefix ex: <http://example.org/> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix skos: <http://www.w3.org/2004/02/skos/core#> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+ex:c rdfs:subClassOf skos:Concept ;
+    skos:notation "1", "1"^^xsd:integer, "1"@en, "2", "2"^^xsd:integer .
+"""
+
+
+class CheckRdfQualityTest(unittest.TestCase):
+    """check_rdf_quality gives the same report with rdflib and with pyoxigraph."""
+
+    def _write(self, text):
+        fd, path = tempfile.mkstemp(suffix=".ttl")
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def test_explicit_xsd_string_literals(self):
+        if quality_check.pyoxigraph is None:
+            self.skipTest("pyoxigraph is not installed")
+        path = self._write(_TTL_TYPED_STRINGS)
+        with mock.patch.object(quality_check, "pyoxigraph", None):
+            expected = quality_check.check_rdf_quality(path)
+        self.assertEqual(expected["unique_objects_count"], 5)
+        self.assertEqual(quality_check.check_rdf_quality(path), expected)
+
+    def test_notations_are_counted_by_lexical_form(self):
+        path = self._write(_TTL_TYPED_NOTATIONS)
+        with mock.patch.object(quality_check, "pyoxigraph", None):
+            report = quality_check.check_rdf_quality(path)
+        self.assertEqual(report["diverse_notation_count"], 2)
+        if quality_check.pyoxigraph is not None:
+            self.assertEqual(quality_check.check_rdf_quality(path), report)
+
+    def test_old_pyoxigraph_falls_back_to_rdflib(self):
+        # A release without RdfFormat / parser prefixes (pyoxigraph < 0.5)
+        old_release = types.ModuleType("pyoxigraph")
+        self.addCleanup(importlib.reload, quality_check)
+        with mock.patch.dict(sys.modules, {"pyoxigraph": old_release}):
+            importlib.reload(quality_check)
+        self.assertIsNone(quality_check.pyoxigraph)
+        report = quality_check.check_rdf_quality(self._write(_TTL_TYPED_STRINGS))
+        self.assertEqual(report["unique_objects_count"], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()